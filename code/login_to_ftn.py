@@ -5,10 +5,13 @@
 
 """Open Firefox with dedicated FTN profile for manual login."""
 
+import signal
+import threading
 from pathlib import Path
-from playwright.sync_api import sync_playwright
 
 def main():
+    from playwright.sync_api import sync_playwright
+
     profile_dir = Path(__file__).parent / ".firefox-profile-ftn"
     profile_dir.mkdir(exist_ok=True)
 
@@ -36,10 +39,13 @@ def main():
         page.goto("https://fixthenews.com")
 
         try:
-            # Wait indefinitely
+            # Sleep until Ctrl+C instead of polling the browser
             print("\nBrowser is open. Press Ctrl+C when you're done...")
             while True:
-                page.wait_for_timeout(1000)
+                if hasattr(signal, 'pause'):
+                    signal.pause()
+                else:  # Windows has no signal.pause()
+                    threading.Event().wait()
         except KeyboardInterrupt:
             print("\n\n✅ Closing browser. Your session has been saved!")
             print(f"   Profile saved to: {profile_dir}")
@@ -5,14 +5,21 @@
 """PDF caching layer for News, Fixed web application."""
 
 import os
-import json
 import shutil
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
+import orjson
 from utils import get_target_week_monday
 
 
+# get_current_week() result and the monotonic time it was computed; the
+# week only rolls over on Fridays, so a minute of staleness is harmless
+_WEEK_CACHE_TTL = 60.0
+_week_cache: tuple[float, str] = (float('-inf'), '')
+
+
 def get_current_week() -> str:
     """
     Get the current newspaper week in YYYY-WWW format.
@@ -25,8 +32,15 @@ def get_current_week() -> str:
     Returns:
         String like '2026-W03' for week 3 of 2026
     """
+    global _week_cache
+    now = time.monotonic()
+    if now - _week_cache[0] < _WEEK_CACHE_TTL:
+        return _week_cache[1]
+
     target = get_target_week_monday()
-    return f"{target.year}-W{target.isocalendar()[1]:02d}"
+    week = f"{target.year}-W{target.isocalendar()[1]:02d}"
+    _week_cache = (now, week)
+    return week
 
 
 def get_week_for_date(date: datetime) -> str:
@@ -77,9 +91,11 @@ class PDFCache:
 
         pdf_path = self._week_dir(week) / "combined.pdf"
 
-        if pdf_path.exists():
-            return pdf_path
-        return None
+        try:
+            os.stat(pdf_path)
+        except OSError:
+            return None
+        return pdf_path
 
     def cache_pdf(self, pdf_source: Path, week: str = None) -> Path:
         """
@@ -100,9 +116,20 @@ class PDFCache:
 
         pdf_dest = week_dir / "combined.pdf"
 
-        # Copy file to cache
+        # Copy file to cache (copy2 already uses sendfile where available)
         shutil.copy2(pdf_source, pdf_dest)
 
+        # The cached PDF is read rarely and much later, so drop it from the
+        # page cache rather than evicting the web process's working set.
+        # Pages must be written back first or DONTNEED leaves them cached.
+        if hasattr(os, 'posix_fadvise'):
+            fd = os.open(pdf_dest, os.O_RDONLY)
+            try:
+                os.fdatasync(fd)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
         # Save metadata
         metadata = {
             'week': week,
@@ -112,8 +139,7 @@ class PDFCache:
         }
 
         metadata_path = week_dir / "metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
         return pdf_dest
 
@@ -130,12 +156,40 @@ class PDFCache:
         if week is None:
             week = get_current_week()
 
-        metadata_path = self._week_dir(week) / "metadata.json"
+        return self._read_metadata(self._week_dir(week))
+
+    def _read_metadata(self, week_dir: Path) -> Optional[dict]:
+        """Read a week directory's metadata.json, or None if it can't be read."""
+        # Open directly rather than exists() + open(): one syscall, no race
+        try:
+            return orjson.loads((week_dir / "metadata.json").read_bytes())
+        except OSError:
+            return None
 
-        if metadata_path.exists():
-            with open(metadata_path, 'r') as f:
-                return json.load(f)
-        return None
+    def probe(self, week: str = None) -> Optional[tuple[Path, Optional[dict]]]:
+        """
+        Look up a week's cached PDF and its metadata.
+
+        Resolves the week directory once, then stats the PDF and reads the
+        metadata from it (web.py's landing page needs both).
+
+        Args:
+            week: ISO week string (default: current week)
+
+        Returns:
+            (pdf_path, metadata) or None if no PDF is cached;
+            metadata is None if the PDF has none
+        """
+        if week is None:
+            week = get_current_week()
+
+        week_dir = self._week_dir(week)
+        pdf_path = week_dir / "combined.pdf"
+        try:
+            os.stat(pdf_path)
+        except OSError:
+            return None
+        return pdf_path, self._read_metadata(week_dir)
 
     def is_cached(self, week: str = None) -> bool:
         """
@@ -173,11 +227,15 @@ class PDFCache:
         Returns:
             List of ISO week strings with cached PDFs
         """
-        weeks = []
-        for item in self.cache_dir.iterdir():
-            if item.is_dir() and item.name.startswith('20') and '-W' in item.name:
-                if (item / "combined.pdf").exists():
-                    weeks.append(item.name)
+        # DirEntry.is_dir() uses the file type from the directory listing and
+        # only stats symlinks, so the combined.pdf probe is the main per-week cost
+        with os.scandir(self.cache_dir) as entries:
+            weeks = [
+                entry.name for entry in entries
+                if entry.is_dir()
+                and entry.name.startswith('20') and '-W' in entry.name
+                and os.path.exists(os.path.join(entry.path, "combined.pdf"))
+            ]
         return sorted(weeks, reverse=True)
 
 
@@ -11,6 +11,7 @@ the interactive CLI (main.py) and the unattended web generator (scheduled_genera
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from utils import get_theme_name
 
 
@@ -52,7 +53,8 @@ def generate_day_content(
     day_data: dict,
     day_num: int,
     mode_default: str = 'family',
-    on_progress=None
+    on_progress=None,
+    on_mini_article=None
 ) -> dict:
     """
     Generate all content for a single day's newspaper.
@@ -66,6 +68,8 @@ def generate_day_content(
         day_num: Day number (1-4)
         mode_default: Default mode for this context ('family' for CLI, 'friends' for web)
         on_progress: Optional callback for progress messages, e.g. click.echo or logger.info
+        on_mini_article: Optional no-argument callback invoked as each mini article
+            finishes (called from worker threads), e.g. to advance a progress bar
 
     Returns:
         Dict with all generated content:
@@ -79,55 +83,80 @@ def generate_day_content(
         if on_progress:
             on_progress(msg)
 
-    # Generate main story
-    log(f"Generating main story...")
-    main_story = content_gen.generate_main_story(
-        original_content=day_data['main_story']['content'],
-        source_url=day_data['main_story']['source_url'],
-        theme=get_theme_name(day_num),
-        original_title=day_data['main_story'].get('title', '')
-    )
-    main_story['source_url'] = day_data['main_story']['source_url']
-
-    # Generate mini articles
-    mini_articles = []
-    for article_data in day_data.get('mini_articles', []):
+    theme = get_theme_name(day_num)
+    next_theme = get_theme_name(day_num + 1) if day_num < 4 else None
+
+    def rewrite_mini(article_data):
         mini_article = content_gen.generate_mini_article(
             original_content=article_data['content'],
             source_url=article_data['source_url'],
             original_title=article_data.get('title', '')
         )
         mini_article['source_url'] = article_data['source_url']
-        mini_articles.append(mini_article)
-
-    # Generate statistics - include content, not just titles
-    # Claude needs actual article text to extract statistics reliably
-    stories_summary = f"Main Story: {main_story['title']}\n{main_story['content'][:500]}\n\n"
-    for article in mini_articles:
-        stories_summary += f"Article: {article['title']}\n{article['content'][:300]}\n\n"
-    statistics = content_gen.generate_statistics(
-        stories_summary=stories_summary,
-        theme=get_theme_name(day_num)
-    )
-
-    # Generate tomorrow teaser (except for Thursday)
-    tomorrow_teaser = ""
-    if day_num < 4:
-        tomorrow_teaser = content_gen.generate_teaser(
-            tomorrow_theme=get_theme_name(day_num + 1)
-        )
-
-    # Generate second main story for friends mode
-    second_main_story = None
+        if on_mini_article:
+            on_mini_article()
+        return mini_article
+
+    # Every call except statistics is an independent API round-trip, so issue
+    # them all at once; the day then costs roughly two round-trips
+    main_data = day_data['main_story']
+    main_source_url = main_data['source_url']
+    mini_data = day_data.get('mini_articles', [])
+    second_story_data = None
     if is_friends_mode(mode_default):
         second_story_data = day_data.get('second_story', {})
-        if second_story_data and second_story_data.get('content'):
-            second_main_story = content_gen.generate_second_main_story(
+        if not (second_story_data and second_story_data.get('content')):
+            second_story_data = None
+
+    log(f"Generating main story and {len(mini_data)} mini articles...")
+    with ThreadPoolExecutor(max_workers=len(mini_data) + 3) as executor:
+        # Generate tomorrow teaser (except for Thursday)
+        teaser_future = None
+        if next_theme:
+            teaser_future = executor.submit(
+                content_gen.generate_teaser,
+                tomorrow_theme=next_theme
+            )
+
+        # Generate second main story for friends mode
+        second_future = None
+        if second_story_data:
+            second_future = executor.submit(
+                content_gen.generate_second_main_story,
                 original_content=second_story_data['content'],
                 source_url=second_story_data['source_url'],
-                theme=get_theme_name(day_num),
+                theme=theme,
                 original_title=second_story_data.get('title', '')
             )
+
+        main_future = executor.submit(
+            content_gen.generate_main_story,
+            original_content=main_data['content'],
+            source_url=main_source_url,
+            theme=theme,
+            original_title=main_data.get('title', '')
+        )
+        # map() preserves input order
+        mini_articles = list(executor.map(rewrite_mini, mini_data))
+        main_story = main_future.result()
+        main_story['source_url'] = main_source_url
+
+        # Generate statistics - include content, not just titles
+        # Claude needs actual article text to extract statistics reliably
+        stories_summary = f"Main Story: {main_story['title']}\n{main_story['content'][:500]}\n\n" + "".join(
+            f"Article: {article['title']}\n{article['content'][:300]}\n\n"
+            for article in mini_articles
+        )
+        statistics = content_gen.generate_statistics(
+            stories_summary=stories_summary,
+            theme=theme
+        )
+
+        tomorrow_teaser = teaser_future.result() if teaser_future else ""
+
+        second_main_story = None
+        if second_future:
+            second_main_story = second_future.result()
             second_main_story['source_url'] = second_story_data['source_url']
 
     return {
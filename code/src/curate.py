@@ -11,8 +11,9 @@ Usage:
     python code/curate.py data/processed/ftn-316.json --output data/processed/custom-name.json
 """
 
+import os
 import sys
-from pathlib import Path
+import traceback
 import click
 from curator import StoryCurator
 
@@ -42,7 +43,9 @@ def _run_unused_review(curator):
               help='Output filename (default: {input}-curated.json)')
 @click.option('--dry-run', is_flag=True,
               help='Preview without saving')
-def main(json_file, output, dry_run):
+@click.option('--pretty', is_flag=True,
+              help='Indent the saved JSON for human reading')
+def main(json_file, output, dry_run, pretty):
     """
     Interactively curate FTN stories before newspaper generation.
 
@@ -75,14 +78,12 @@ def main(json_file, output, dry_run):
 
     # Determine output filename
     if output is None:
-        input_path = Path(json_file)
-        output = input_path.parent / f"{input_path.stem}-curated.json"
-    else:
-        output = Path(output)
+        root, _ = os.path.splitext(json_file)
+        output = f"{root}-curated.json"
 
     # Load and display
     try:
-        curator = StoryCurator(Path(json_file), output_file=output)
+        curator = StoryCurator(json_file, output_file=output)
         curator.display_overview()
 
         # Theme review step
@@ -177,7 +178,7 @@ def main(json_file, output, dry_run):
 
         # Save
         click.echo(f"\n💾 Saving to: {output}")
-        curator.save_curated(output)
+        curator.save_curated(output, pretty=pretty)
 
         click.echo(f"\n✨ Next step:")
         click.echo(f"   python code/src/main.py --input {output} --all")
@@ -190,7 +191,6 @@ def main(json_file, output, dry_run):
         sys.exit(1)
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
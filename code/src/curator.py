@@ -9,17 +9,129 @@ methods for display, interactive review, and action handling.
 """
 
 import os
+import sys
 from pathlib import Path
-from typing import Dict, Optional
-from rich.console import Console
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from xkcd import XkcdManager
+from rich.text import Text
+from xkcd import XkcdManager, REJECTION_REASONS
 from utils import get_theme_name
-from curator_data import StoryCuratorData, generate_teasers_for_curated_data  # noqa: F401
+from curator_data import (  # noqa: F401
+    StoryCuratorData, generate_teasers_for_curated_data, _day_key, _display_title, _DAY_KEYS,
+)
 
 console = Console()
 
+# Shared read-only default for missing story slots (avoids a new {} per lookup)
+_EMPTY: Mapping = MappingProxyType({})
+
+# Static cell text for story tables, built once rather than per row
+_ROW_LEN_FMT = "{} chars".format
+_ROW_INDEX = tuple(str(i) for i in range(100))
+
+# Unused stories listed in the overview; the paged unused review shows the rest
+_OVERVIEW_UNUSED_ROWS = 20
+
+
+def _row_index(i: int) -> str:
+    """Get the '#' column label for a 1-based row number."""
+    return _ROW_INDEX[i] if i < len(_ROW_INDEX) else str(i)
+
+
+def _new_day_table(title: str) -> Table:
+    """Create an empty day table with the #/Role/Title/Length columns."""
+    table = Table(title=title)
+    table.add_column("#", style="dim", width=3)
+    table.add_column("Role", width=6)
+    table.add_column("Title", style="cyan")
+    table.add_column("Length", justify="right", width=10)
+    return table
+
+
+def _theme_days(theme_metadata: Dict) -> list:
+    """Get (day number, meta) pairs in day order; keys may be int or str days."""
+    return sorted(((int(day), meta) for day, meta in theme_metadata.items()), key=lambda item: item[0])
+
+
+# Static options menu for the xkcd review loop
+_XKCD_OPTIONS = (
+    "\n[bold]Options:[/bold]\n"
+    "  [A] Accept all - looks good!\n"
+    "  [1-4] Veto comic for that day (pick a different one)\n"
+    "  [S] Skip xkcd for this week\n"
+)
+
+# One-line options reminder shown after a veto instead of the full menu
+_XKCD_OPTIONS_SHORT = "\n[bold]Options:[/bold] [A] Accept all  [1-4] Veto  [S] Skip\n"
+
+
+def _xkcd_selection(comic_num: int, comic: Dict) -> Dict:
+    """Build the review entry for a comic: number, title, summary and URL."""
+    return {
+        "num": comic_num,
+        "title": comic.get("title", "Unknown"),
+        "summary": comic.get("analysis", {}).get("brief_summary", ""),
+        "url": f"https://xkcd.com/{comic_num}/"
+    }
+
+
+def _xkcd_pick_lines(day: int, theme: str, sel: Dict) -> list:
+    """Get the review lines for one day's xkcd pick."""
+    lines = [f"  Day {day} ({theme}): #{sel['num']} \"{sel['title']}\""]
+    if sel['summary']:
+        lines.append(f"         [dim]{sel['summary']}[/dim]")
+    lines.append(f"         [dim]{sel['url']}[/dim]")
+    return lines
+
+
+_ROLE_MARKUP = {"MAIN": "[bold]MAIN[/bold]", "MAIN2": "[bold]MAIN2[/bold]", "mini": "mini"}
+
+
+def _day_rows(day_data: Dict):
+    """Yield (index, role, title, length) cells for each story in a day."""
+    main = day_data.get('main_story') or _EMPTY
+    if main:
+        yield ("1", "MAIN", *_story_row(main))
+
+    second = day_data.get('second_story') or _EMPTY
+    has_second = bool(second.get('title'))
+    if has_second:
+        yield ("2", "MAIN2", *_story_row(second))
+
+    mini_start = 3 if has_second else 2
+    minis = day_data.get('mini_articles') or ()
+    for i, mini in enumerate(minis, start=mini_start):
+        yield (_row_index(i), "mini", *_story_row(mini))
+
+
+def _story_row(story: Dict) -> tuple:
+    """Get the (display title, length label) cells for a story table row."""
+    length = len(story.get('title') or '') + len(story.get('content') or '')
+    return _display_title(story), _ROW_LEN_FMT(length)
+
+
+def _story_panel(story: Dict, label: str, value: str, panel_title: str) -> Panel:
+    """
+    Build the detail panel shown when viewing a story.
+
+    Uses styled Text spans rather than markup, so brackets in article text
+    are shown as-is instead of being parsed as Rich tags.
+    """
+    content = story.get('content', '')
+    excerpt = content if len(content) <= 500 else content[:500] + '...'
+    body = Text.assemble(
+        ("Title:", "bold"), f" {story.get('title', 'Untitled')}\n",
+        ("Length:", "bold"), f" {len(content)} characters\n",
+        ("Source:", "bold"), f" {story.get('source_url', 'No URL')}\n",
+        (f"{label}:", "bold"), f" {value}\n\n",
+        ("Content:", "bold"), "\n",
+        excerpt,
+    )
+    return Panel(body, title=panel_title)
+
 
 class StoryCurator(StoryCuratorData):
     """Interactive TUI layer for story curation.
@@ -28,21 +140,37 @@ class StoryCurator(StoryCuratorData):
     display, review, and interactive action-handling methods.
     """
 
+    # Menu keys for the review prompts and the action each returns
+    _THEME_ACTIONS = {'a': 'accept', 'e': 'edit', 'r': 'revert'}
+    _UNUSED_ACTIONS = {'a': 'accept', 'm': 'move', 'v': 'view'}
+    _DAY_ACTIONS = {'a': 'accept', 'm': 'move', 's': 'swap', 'c': 'combine', 'v': 'view', 'b': 'back'}
+
     def __init__(self, json_file: Path, output_file: Path = None):
         super().__init__(json_file, output_file, console=console)
 
+    @staticmethod
+    def _parse_int_in_range(s: str, lo: int, hi: int) -> Optional[int]:
+        """Parse a menu choice as an int in [lo, hi], or None if it isn't one."""
+        if not s.isdecimal():
+            return None
+        value = int(s)
+        return value if lo <= value <= hi else None
+
     # ── Display methods ─────────────────────────────────────────
 
-    def display_unused_table(self, page: int = 0, page_size: int = 10) -> tuple:
+    def _build_unused_table(self, page: int = 0, page_size: int = 10, max_rows: int = 0) -> tuple:
         """
-        Show one page of unused stories in a Rich table.
+        Build one page of unused stories as a Rich table.
 
         Args:
             page: 0-based page number
             page_size: Stories per page (0 = show all)
+            max_rows: With page_size 0, stop after this many rows and add a
+                "more" footer row (0 = no limit)
 
         Returns:
-            (total_stories, total_pages) tuple
+            (table, total_stories, total_pages) tuple; table is None if
+            there are no unused stories
         """
         unused_stories = []
         if 'unused' in self.working_data:
@@ -50,11 +178,12 @@ class StoryCurator(StoryCuratorData):
 
         total = len(unused_stories)
         if total == 0:
-            return (0, 0)
+            return (None, 0, 0)
 
         if page_size <= 0:
-            # Show all
-            start, end = 0, total
+            # Show all, up to max_rows
+            start = 0
+            end = min(total, max_rows) if max_rows > 0 else total
             total_pages = 1
         else:
             total_pages = (total + page_size - 1) // page_size
@@ -72,71 +201,100 @@ class StoryCurator(StoryCuratorData):
         table.add_column("Length", justify="right", width=10)
 
         for i in range(start, end):
-            story = unused_stories[i]
-            story_title = story.get('tui_headline') or story.get('title', 'Untitled')[:60]
-            full_length = len(story.get('title', '')) + len(story.get('content', ''))
-            table.add_row(str(i + 1), story_title, f"{full_length} chars")
+            table.add_row(_row_index(i + 1), *_story_row(unused_stories[i]))
+        if page_size <= 0 and end < total:
+            table.add_row("", f"[dim]… {total - end} more (see unused review)[/dim]", "")
 
-        console.print(table)
-        console.print()
-        return (total, total_pages)
+        return (table, total, total_pages)
 
-    def display_day_table(self, day_num: int) -> None:
+    def display_unused_table(self, page: int = 0, page_size: int = 10) -> tuple:
         """
-        Show a single day's table.
+        Show one page of unused stories in a Rich table.
 
         Args:
-            day_num: Day number (1-4)
+            page: 0-based page number
+            page_size: Stories per page (0 = show all)
+
+        Returns:
+            (total_stories, total_pages) tuple
         """
-        day_key = f"day_{day_num}"
+        table, total, total_pages = self._build_unused_table(page, page_size)
+        if table is not None:
+            console.print(table)
+            console.print()
+        return (total, total_pages)
+
+    def _build_day_table(self, day_num: int) -> Optional[Table]:
+        """Build a single day's Rich table, or None if the day is missing."""
+        day_key = _day_key(day_num)
         if day_key not in self.working_data:
-            return
+            return None
 
         day_data = self.working_data[day_key]
         theme = day_data.get('theme', 'Unknown Theme')
 
-        table = Table(title=f"Day {day_num}: {theme}")
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Role", width=6)
-        table.add_column("Title", style="cyan")
-        table.add_column("Length", justify="right", width=10)
+        table = _new_day_table(f"Day {day_num}: {theme}")
 
-        # Add main story
-        main = day_data.get('main_story', {})
-        if main:
-            title = main.get('tui_headline') or main.get('title', 'Untitled')[:60]
-            full_length = len(main.get('title', '')) + len(main.get('content', ''))
-            table.add_row("1", "[bold]MAIN[/bold]", title, f"{full_length} chars")
+        # Main story, optional second main story, then mini articles
+        for index, role, title, length in _day_rows(day_data):
+            table.add_row(index, _ROLE_MARKUP[role], title, length)
 
-        # Add second main story (if present)
-        second = day_data.get('second_story', {})
-        has_second = bool(second and second.get('title'))
-        if has_second:
-            title = second.get('tui_headline') or second.get('title', 'Untitled')[:60]
-            full_length = len(second.get('title', '')) + len(second.get('content', ''))
-            table.add_row("2", "[bold]MAIN2[/bold]", title, f"{full_length} chars")
+        return table
 
-        # Add mini articles
-        mini_start = 3 if has_second else 2
-        minis = day_data.get('mini_articles', [])
-        for i, mini in enumerate(minis, start=mini_start):
-            title = mini.get('tui_headline') or mini.get('title', 'Untitled')[:60]
-            full_length = len(mini.get('title', '')) + len(mini.get('content', ''))
-            table.add_row(str(i), "mini", title, f"{full_length} chars")
+    def display_day_table(self, day_num: int) -> None:
+        """
+        Show a single day's table.
 
-        console.print(table)
-        console.print()
+        Args:
+            day_num: Day number (1-4)
+        """
+        table = self._build_day_table(day_num)
+        if table is not None:
+            console.print(table)
+            console.print()
 
     def display_overview(self) -> None:
         """Show unused stories first, then all 4 days in rich tables."""
-        console.print("\n[bold cyan]Story Curation Overview[/bold cyan]\n")
+        if not console.is_terminal:
+            # Piped or scripted: skip Rich table layout entirely
+            self._write_plain_overview()
+            return
 
-        # Display unused stories FIRST (all at once in overview)
-        self.display_unused_table(page_size=0)
+        # Collect everything and render in one print rather than two per table
+        parts = ["\n[bold cyan]Story Curation Overview[/bold cyan]\n"]
+
+        # Unused stories FIRST (capped, the unused review pages through the
+        # rest), then day tables
+        unused_table, _, _ = self._build_unused_table(page_size=0, max_rows=_OVERVIEW_UNUSED_ROWS)
+        tables = [unused_table] + [self._build_day_table(day_num) for day_num in range(1, 5)]
+        for table in tables:
+            if table is not None:
+                parts.extend((table, ""))
+
+        console.print(Group(*parts))
+
+    def _write_plain_overview(self) -> None:
+        """Write the overview as tab-separated plain text to stdout."""
+        lines = ["Story Curation Overview", ""]
+
+        unused_stories = self.working_data.get('unused', _EMPTY).get('stories') or ()
+        if unused_stories:
+            lines.append("Unused Stories")
+            lines.extend(
+                "\t".join((_row_index(i), *_story_row(story)))
+                for i, story in enumerate(unused_stories, start=1)
+            )
+            lines.append("")
+
+        for day_num, day_key in enumerate(_DAY_KEYS, 1):
+            day_data = self.working_data.get(day_key)
+            if day_data is None:
+                continue
+            lines.append(f"Day {day_num}: {day_data.get('theme', 'Unknown Theme')}")
+            lines.extend("\t".join(row) for row in _day_rows(day_data))
+            lines.append("")
 
-        # Then display day tables
-        for day_num in range(1, 5):
-            self.display_day_table(day_num)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # ── Interactive review methods ──────────────────────────────
 
@@ -165,10 +323,9 @@ class StoryCurator(StoryCuratorData):
         table.add_column("Status", width=12)
         table.add_column("Stories", justify="right", width=8)
 
-        for day in sorted(theme_metadata.keys(), key=lambda x: int(x) if isinstance(x, str) else x):
-            day_int = int(day) if isinstance(day, str) else day
-            meta = theme_metadata[day]
-
+        # Collect non-default themes in the same pass for the note below
+        non_defaults = []
+        for day_int, meta in _theme_days(theme_metadata):
             # Get theme health if available
             status = meta.get("status", "unknown")
             story_count = meta.get("story_count", "?")
@@ -194,6 +351,8 @@ class StoryCurator(StoryCuratorData):
                 source_display = f"[magenta]split[/magenta]"
             else:
                 source_display = source
+            if source != "default":
+                non_defaults.append((day_int, meta))
 
             table.add_row(
                 str(day_int),
@@ -206,35 +365,26 @@ class StoryCurator(StoryCuratorData):
         console.print(table)
 
         # Show any non-default themes prominently
-        non_defaults = [
-            (day, meta) for day, meta in theme_metadata.items()
-            if meta.get("source") != "default"
-        ]
-
         if non_defaults:
             console.print("\n[bold yellow]Note:[/bold yellow] Some themes were dynamically generated:")
-            for day, meta in non_defaults:
-                day_int = int(day) if isinstance(day, str) else day
+            for day_int, meta in non_defaults:
                 console.print(f"  • Day {day_int}: [cyan]{meta.get('name')}[/cyan] ({meta.get('source')})")
 
         # Show action menu
-        console.print("\n[bold]Actions:[/bold]")
-        console.print("  [A] Accept themes and continue")
-        console.print("  [E] Edit theme names")
-        console.print("  [R] Revert to default themes")
-        console.print()
+        console.print(
+            "\n[bold]Actions:[/bold]\n"
+            "  [A] Accept themes and continue\n"
+            "  [E] Edit theme names\n"
+            "  [R] Revert to default themes\n"
+        )
 
         while True:
             choice = console.input("[bold]Choose action: [/bold]").strip().lower()
 
-            if choice == 'a':
-                return 'accept'
-            elif choice == 'e':
-                return 'edit'
-            elif choice == 'r':
-                return 'revert'
-            else:
-                console.print("[red]Invalid choice. Use A, E, or R.[/red]")
+            action = self._THEME_ACTIONS.get(choice)
+            if action is not None:
+                return action
+            console.print("[red]Invalid choice. Use A, E, or R.[/red]")
 
     def edit_themes(self) -> dict:
         """
@@ -253,9 +403,7 @@ class StoryCurator(StoryCuratorData):
         console.print("[dim]Press Enter to keep current name, or type new name[/dim]\n")
 
         updated_themes = {}
-        for day in sorted(theme_metadata.keys(), key=lambda x: int(x) if isinstance(x, str) else x):
-            day_int = int(day) if isinstance(day, str) else day
-            meta = theme_metadata[day]
+        for day_int, meta in _theme_days(theme_metadata):
             current_name = meta.get("name", "Unknown")
 
             new_name = console.input(f"Day {day_int} [{current_name}]: ").strip()
@@ -283,7 +431,7 @@ class StoryCurator(StoryCuratorData):
             day_num: Day number (1-4)
             story_index: Story index (1-based, 1=main, 2+=minis)
         """
-        day_key = f"day_{day_num}"
+        day_key = _day_key(day_num)
         if day_key not in self.working_data:
             console.print(f"[red]Error: {day_key} not found[/red]")
             return
@@ -298,22 +446,9 @@ class StoryCurator(StoryCuratorData):
         role_names = {'main': 'MAIN story', 'second': 'second main story', 'mini': 'mini article'}
         role = role_names.get(slot_type, 'story')
 
-        # Display story details
-        title = story.get('title', 'Untitled')
-        content = story.get('content', '')
-        source_url = story.get('source_url', 'No URL')
-
-        panel_content = f"""[bold]Title:[/bold] {title}
-[bold]Length:[/bold] {len(content)} characters
-[bold]Source:[/bold] {source_url}
-[bold]Role:[/bold] {role}
-
-[bold]Content:[/bold]
-{content[:500]}{'...' if len(content) > 500 else ''}"""
+        console.print(_story_panel(story, "Role", role, f"Day {day_num} - Story {story_index}"))
 
-        console.print(Panel(panel_content, title=f"Day {day_num} - Story {story_index}"))
-
-    def _handle_overflow(self, to_day: int, incoming_story: dict) -> Optional[dict]:
+    def _handle_overflow(self, to_day: int, incoming_story: dict) -> tuple[str, Optional[dict]]:
         """
         Handle adding story to a full day (5 stories already).
 
@@ -322,9 +457,11 @@ class StoryCurator(StoryCuratorData):
             incoming_story: Story being moved
 
         Returns:
-            Story to swap back to source day, or None if cancelled/replaced
+            (outcome, swapped_story): outcome is 'cancel', 'replace' or 'swap';
+            swapped_story is the story to put back in the source day on a
+            swap, else None
         """
-        to_data = self.working_data[f"day_{to_day}"]
+        to_data = self.working_data[_day_key(to_day)]
         minis = to_data.get('mini_articles', [])
 
         incoming_title = incoming_story.get('title', 'Untitled')[:40]
@@ -332,22 +469,24 @@ class StoryCurator(StoryCuratorData):
         to_has_second = self._has_second_story(to_data)
         max_capacity = 6 if to_has_second else 5
         capacity_desc = "2 main + 4 minis" if to_has_second else "1 main + 4 minis"
-        console.print(f"\n[yellow]⚠️  Warning: Day {to_day} already has {max_capacity} stories ({capacity_desc})[/yellow]")
-        console.print(f"   Moving '{incoming_title}' would exceed the limit.\n")
-        console.print("Options:")
-        console.print("  [S] Swap with an existing mini article")
-        console.print("  [R] Replace an existing mini article")
-        console.print("  [C] Cancel move")
+        console.print(
+            f"\n[yellow]⚠️  Warning: Day {to_day} already has {max_capacity} stories ({capacity_desc})[/yellow]\n"
+            f"   Moving '{incoming_title}' would exceed the limit.\n\n"
+            "Options:\n"
+            "  [S] Swap with an existing mini article\n"
+            "  [R] Replace an existing mini article\n"
+            "  [C] Cancel move"
+        )
 
         choice = console.input("\nChoice: ").strip().lower()
 
         if choice == 'c':
             console.print("[yellow]Move cancelled[/yellow]")
-            return None
+            return 'cancel', None
 
         if choice not in ['s', 'r']:
             console.print("[yellow]Invalid choice, cancelling move[/yellow]")
-            return None
+            return 'cancel', None
 
         # Show mini articles to swap/replace
         console.print(f"\n{'Swap' if choice == 's' else 'Replace'} with which Day {to_day} mini article?")
@@ -360,33 +499,29 @@ class StoryCurator(StoryCuratorData):
 
         if target == 'back':
             console.print("[yellow]Move cancelled[/yellow]")
-            return None
+            return 'cancel', None
 
-        try:
-            target_idx = int(target) - 1
-            if target_idx < 0 or target_idx >= len(minis):
-                console.print("[red]Invalid choice, cancelling move[/red]")
-                return None
-
-            target_story = minis[target_idx]
-            target_title = target_story.get('title', 'Untitled')[:40]
+        target_num = self._parse_int_in_range(target, 1, len(minis))
+        if target_num is None:
+            console.print("[red]Invalid choice, cancelling move[/red]")
+            return 'cancel', None
 
-            # Add incoming story to target day
-            minis[target_idx] = incoming_story
+        target_idx = target_num - 1
+        target_story = minis[target_idx]
+        target_title = target_story.get('title', 'Untitled')[:40]
 
-            if choice == 's':
-                # Swap: return target story to source day
-                console.print(f"[green]✓[/green] Swapped: {incoming_title} ↔ {target_title}")
-                return target_story
-            else:
-                # Replace: target story is removed
-                console.print(f"[green]✓[/green] Replaced {target_title} with {incoming_title}")
-                console.print(f"[dim]  ({target_title} removed from curation)[/dim]")
-                return None
+        # Add incoming story to target day
+        minis[target_idx] = incoming_story
 
-        except ValueError:
-            console.print("[red]Invalid choice, cancelling move[/red]")
-            return None
+        if choice == 's':
+            # Swap: return target story to source day
+            console.print(f"[green]✓[/green] Swapped: {incoming_title} ↔ {target_title}")
+            return 'swap', target_story
+        else:
+            # Replace: target story is removed
+            console.print(f"[green]✓[/green] Replaced {target_title} with {incoming_title}")
+            console.print(f"[dim]  ({target_title} removed from curation)[/dim]")
+            return 'replace', None
 
     def review_unused(self, page: int = 0) -> str:
         """
@@ -416,43 +551,42 @@ class StoryCurator(StoryCuratorData):
             end = min((page + 1) * 10, total)
             console.print(f"[dim]Showing stories {start}-{end} of {total}[/dim]")
 
-        console.print(f"\n[bold]Review Unused Stories ({max_index} total)[/bold]")
-        console.print("  [A] Accept as-is (keep all unused)")
-        console.print("  [M] Move story to a day")
-        console.print("  [V] View story details")
-        console.print(f"  [1-{max_index}] Quick move story # to a day")
+        # Build the menu and print it in one call
+        menu = [
+            f"\n[bold]Review Unused Stories ({max_index} total)[/bold]",
+            "  [A] Accept as-is (keep all unused)",
+            "  [M] Move story to a day",
+            "  [V] View story details",
+            f"  [1-{max_index}] Quick move story # to a day",
+        ]
         if total_pages > 1:
             if page < total_pages - 1:
-                console.print("  [N] Next page")
+                menu.append("  [N] Next page")
             if page > 0:
-                console.print("  [P] Previous page")
+                menu.append("  [P] Previous page")
+        console.print("\n".join(menu))
 
         choice = console.input("\n[cyan]Choice:[/cyan] ").strip().lower()
 
         # Check for numeric shortcut (e.g., "3" means move unused story 3)
-        if choice.isdigit():
-            story_num = int(choice)
-            if 1 <= story_num <= max_index:
-                # Trigger move action with this story number pre-selected
-                self._handle_unused_move_action(story_num)
-                return 'move'  # Signal that we handled a move
-            else:
+        if choice.isdecimal():
+            story_num = self._parse_int_in_range(choice, 1, max_index)
+            if story_num is None:
                 console.print(f"[red]Invalid story number (must be 1-{max_index})[/red]")
                 return 'accept'
-
-        if choice == 'a':
-            return 'accept'
-        elif choice == 'm':
-            return 'move'
-        elif choice == 'v':
-            return 'view'
-        elif choice == 'n' and total_pages > 1 and page < total_pages - 1:
+            # Trigger move action with this story number pre-selected
+            self._handle_unused_move_action(story_num)
+            return 'move'  # Signal that we handled a move
+
+        action = self._UNUSED_ACTIONS.get(choice)
+        if action is not None:
+            return action
+        if choice == 'n' and total_pages > 1 and page < total_pages - 1:
             return 'next_page'
-        elif choice == 'p' and total_pages > 1 and page > 0:
+        if choice == 'p' and total_pages > 1 and page > 0:
             return 'prev_page'
-        else:
-            console.print("[yellow]Invalid choice, treating as 'accept'[/yellow]")
-            return 'accept'
+        console.print("[yellow]Invalid choice, treating as 'accept'[/yellow]")
+        return 'accept'
 
     def _handle_unused_move_action(self, preselected_story: int = None) -> None:
         """Handle moving a story from unused to a day.
@@ -471,9 +605,8 @@ class StoryCurator(StoryCuratorData):
             if story_num == 'back':
                 return
 
-            try:
-                story_index = int(story_num)
-            except ValueError:
+            story_index = self._parse_int_in_range(story_num, 1, max_index)
+            if story_index is None:
                 console.print("[red]Invalid story number[/red]")
                 return
 
@@ -486,14 +619,11 @@ class StoryCurator(StoryCuratorData):
         if target == 'back':
             return
 
-        try:
-            to_day = int(target)
-            if to_day < 1 or to_day > 4:
-                console.print("[red]Invalid day number[/red]")
-                return
-            self.move_from_unused(story_index, to_day)
-        except ValueError:
-            console.print("[red]Invalid choice[/red]")
+        to_day = self._parse_int_in_range(target, 1, 4)
+        if to_day is None:
+            console.print("[red]Invalid day number[/red]")
+            return
+        self.move_from_unused(story_index, to_day)
 
     def _handle_unused_view_action(self) -> None:
         """Handle viewing an unused story."""
@@ -505,29 +635,16 @@ class StoryCurator(StoryCuratorData):
         if story_num == 'back':
             return
 
-        try:
-            story_index = int(story_num)
-            if story_index < 1 or story_index > max_index:
-                console.print(f"[red]Invalid story number[/red]")
-                return
-
-            story = unused_stories[story_index - 1]
-            title = story.get('title', 'Untitled')
-            content = story.get('content', '')
-            source_url = story.get('source_url', 'No URL')
-
-            panel_content = f"""[bold]Title:[/bold] {title}
-[bold]Length:[/bold] {len(content)} characters
-[bold]Source:[/bold] {source_url}
-[bold]Status:[/bold] Unused (will not appear in newspaper)
-
-[bold]Content:[/bold]
-{content[:500]}{'...' if len(content) > 500 else ''}"""
-
-            console.print(Panel(panel_content, title=f"Unused Story {story_index}"))
-            console.input("\nPress Enter to continue...")
-        except ValueError:
+        story_index = self._parse_int_in_range(story_num, 1, max_index)
+        if story_index is None:
             console.print("[red]Invalid story number[/red]")
+            return
+
+        story = unused_stories[story_index - 1]
+        console.print(_story_panel(
+            story, "Status", "Unused (will not appear in newspaper)", f"Unused Story {story_index}"
+        ))
+        console.input("\nPress Enter to continue...")
 
     def review_day(self, day_num: int) -> str:
         """
@@ -539,7 +656,7 @@ class StoryCurator(StoryCuratorData):
         Returns:
             User's choice: 'accept', 'move', 'swap', 'view', 'back'
         """
-        day_key = f"day_{day_num}"
+        day_key = _day_key(day_num)
         if day_key not in self.working_data:
             console.print(f"[red]Error: {day_key} not found[/red]")
             return 'accept'
@@ -561,50 +678,39 @@ class StoryCurator(StoryCuratorData):
             console.print(f"[dim]   Maximum is {capacity_desc} = {max_capacity} total stories[/dim]")
             console.print(f"[dim]   You need to remove at least {total_stories - max_capacity} stories[/dim]\n")
 
-        console.print(f"\n[bold]Review Day {day_num}: {theme}[/bold]")
-        console.print("  [A] Accept as-is")
-        console.print("  [M] Move stories to different day")
-        console.print("  [S] Swap main/mini assignments")
-        console.print("  [C] Combine 2+ stories into one")
-        console.print("  [V] View story details")
-        console.print(f"  [1-{max_index}] Quick move story # to another day")
-        if day_num == 1:
-            console.print("  [B] Back to unused stories")
-        else:
-            console.print("  [B] Back to previous day")
+        back_to = "unused stories" if day_num == 1 else "previous day"
+        console.print(
+            f"\n[bold]Review Day {day_num}: {theme}[/bold]\n"
+            "  [A] Accept as-is\n"
+            "  [M] Move stories to different day\n"
+            "  [S] Swap main/mini assignments\n"
+            "  [C] Combine 2+ stories into one\n"
+            "  [V] View story details\n"
+            f"  [1-{max_index}] Quick move story # to another day\n"
+            f"  [B] Back to {back_to}"
+        )
 
         choice = console.input("\n[cyan]Choice:[/cyan] ").strip().lower()
 
         # Check for numeric shortcut (e.g., "3" means move story 3)
-        if choice.isdigit():
-            story_num = int(choice)
-            if 1 <= story_num <= max_index:
-                # Trigger move action with this story number pre-selected
-                self._handle_move_action(day_num, story_num)
-                return 'move'  # Signal that we handled a move
-            else:
+        if choice.isdecimal():
+            story_num = self._parse_int_in_range(choice, 1, max_index)
+            if story_num is None:
                 console.print(f"[red]Invalid story number (must be 1-{max_index})[/red]")
                 return 'accept'
+            # Trigger move action with this story number pre-selected
+            self._handle_move_action(day_num, story_num)
+            return 'move'  # Signal that we handled a move
 
-        if choice == 'a':
-            return 'accept'
-        elif choice == 'm':
-            return 'move'
-        elif choice == 's':
-            return 'swap'
-        elif choice == 'c':
-            return 'combine'
-        elif choice == 'v':
-            return 'view'
-        elif choice == 'b':
-            return 'back'
-        else:
-            console.print("[yellow]Invalid choice, treating as 'accept'[/yellow]")
-            return 'accept'
+        action = self._DAY_ACTIONS.get(choice)
+        if action is not None:
+            return action
+        console.print("[yellow]Invalid choice, treating as 'accept'[/yellow]")
+        return 'accept'
 
     def _handle_view_action(self, day_num: int) -> None:
         """Handle view story action."""
-        day_data = self.working_data[f"day_{day_num}"]
+        day_data = self.working_data[_day_key(day_num)]
         max_index = self._total_stories(day_data)
 
         story_num = console.input(f"Which story? (1-{max_index}, or 'back'): ").strip()
@@ -612,15 +718,17 @@ class StoryCurator(StoryCuratorData):
         if story_num == 'back':
             return
 
-        try:
-            self.view_story(day_num, int(story_num))
-            console.input("\nPress Enter to continue...")
-        except ValueError:
+        story_index = self._parse_int_in_range(story_num, 1, max_index)
+        if story_index is None:
             console.print("[red]Invalid story number[/red]")
+            return
+
+        self.view_story(day_num, story_index)
+        console.input("\nPress Enter to continue...")
 
     def _handle_swap_action(self, day_num: int) -> None:
         """Handle swap/promote story roles."""
-        day_data = self.working_data[f"day_{day_num}"]
+        day_data = self.working_data[_day_key(day_num)]
         has_second = self._has_second_story(day_data)
         mini_start = self._mini_start_index(day_data)
         minis = day_data.get('mini_articles', [])
@@ -632,12 +740,12 @@ class StoryCurator(StoryCuratorData):
         # Offer promote option when second main slot is empty and minis exist
         can_promote = not has_second and len(minis) > 0
 
-        console.print("\n[bold]Reassign story roles:[/bold]")
-        console.print("  [S] Swap main story with another")
+        menu = ["\n[bold]Reassign story roles:[/bold]", "  [S] Swap main story with another"]
         if can_promote:
-            console.print("  [P] Promote a mini to second main story")
+            menu.append("  [P] Promote a mini to second main story")
         if has_second:
-            console.print("  [D] Demote second main to mini")
+            menu.append("  [D] Demote second main to mini")
+        console.print("\n".join(menu))
 
         sub_choice = console.input("\nChoice (or 'back'): ").strip().lower()
 
@@ -655,7 +763,7 @@ class StoryCurator(StoryCuratorData):
 
     def _swap_main_submenu(self, day_num: int) -> None:
         """Show the swap-main-story submenu."""
-        day_data = self.working_data[f"day_{day_num}"]
+        day_data = self.working_data[_day_key(day_num)]
         has_second = self._has_second_story(day_data)
         mini_start = self._mini_start_index(day_data)
         minis = day_data.get('mini_articles', [])
@@ -680,14 +788,16 @@ class StoryCurator(StoryCuratorData):
         if choice == 'back':
             return
 
-        try:
-            self.swap_main_story(day_num, int(choice))
-        except ValueError:
+        new_main = self._parse_int_in_range(choice, 2, max_choice)
+        if new_main is None:
             console.print("[red]Invalid choice[/red]")
+            return
+
+        self.swap_main_story(day_num, new_main)
 
     def _promote_to_second_main(self, day_num: int) -> None:
         """Promote a mini article to the second main story slot."""
-        day_key = f"day_{day_num}"
+        day_key = _day_key(day_num)
         day_data = self.working_data[day_key]
         mini_start = self._mini_start_index(day_data)
         minis = day_data.get('mini_articles', [])
@@ -707,28 +817,24 @@ class StoryCurator(StoryCuratorData):
         if choice == 'back':
             return
 
-        try:
-            idx = int(choice)
-            mini_idx = idx - mini_start
-            if mini_idx < 0 or mini_idx >= len(minis):
-                console.print(f"[red]Invalid choice[/red]")
-                return
+        idx = self._parse_int_in_range(choice, mini_start, mini_start + len(minis) - 1)
+        if idx is None:
+            console.print("[red]Invalid choice[/red]")
+            return
 
-            promoted = minis.pop(mini_idx)
-            day_data['second_story'] = promoted
+        promoted = minis.pop(idx - mini_start)
+        day_data['second_story'] = promoted
 
-            title = promoted.get('title', 'Untitled')[:50]
-            change_msg = f"Day {day_num}: Promoted '{title}' to second main story"
-            self.changes_made.append(change_msg)
-            console.print(f"[green]✓[/green] {change_msg}")
+        title = promoted.get('title', 'Untitled')[:50]
+        change_msg = f"Day {day_num}: Promoted '{title}' to second main story"
+        self._record_change(change_msg)
+        console.print(f"[green]✓[/green] {change_msg}")
 
-            self._auto_save()
-        except ValueError:
-            console.print("[red]Invalid choice[/red]")
+        self._auto_save()
 
     def _demote_second_main(self, day_num: int) -> None:
         """Demote the second main story back to a mini article."""
-        day_key = f"day_{day_num}"
+        day_key = _day_key(day_num)
         day_data = self.working_data[day_key]
 
         second = day_data.get('second_story', {})
@@ -742,7 +848,7 @@ class StoryCurator(StoryCuratorData):
         day_data['second_story'] = {}
 
         change_msg = f"Day {day_num}: Demoted '{title}' from second main to mini"
-        self.changes_made.append(change_msg)
+        self._record_change(change_msg)
         console.print(f"[green]✓[/green] {change_msg}")
 
         self._auto_save()
@@ -754,7 +860,7 @@ class StoryCurator(StoryCuratorData):
             day_num: Day number (1-4)
             preselected_story: If provided, skip asking which story to move
         """
-        day_data = self.working_data[f"day_{day_num}"]
+        day_data = self.working_data[_day_key(day_num)]
         max_index = self._total_stories(day_data)
 
         if preselected_story is not None:
@@ -765,9 +871,8 @@ class StoryCurator(StoryCuratorData):
             if story_num == 'back':
                 return
 
-            try:
-                story_index = int(story_num)
-            except ValueError:
+            story_index = self._parse_int_in_range(story_num, 1, max_index)
+            if story_index is None:
                 console.print("[red]Invalid story number[/red]")
                 return
 
@@ -787,14 +892,14 @@ class StoryCurator(StoryCuratorData):
             self.move_to_unused(day_num, story_index)
             return
 
-        try:
-            to_day = int(target)
-            if to_day == day_num:
-                console.print("[yellow]Story is already in this day[/yellow]")
-                return
-            self.move_story(day_num, story_index, to_day)
-        except ValueError:
+        to_day = self._parse_int_in_range(target, 1, 4)
+        if to_day is None:
             console.print("[red]Invalid choice[/red]")
+            return
+        if to_day == day_num:
+            console.print("[yellow]Story is already in this day[/yellow]")
+            return
+        self.move_story(day_num, story_index, to_day)
 
     def _handle_combine_action(self, day_num: int) -> None:
         """
@@ -803,7 +908,7 @@ class StoryCurator(StoryCuratorData):
         Merges raw content (no Claude API call). The generator rewrites later.
         Preserves all source URLs for multi-QR-code rendering.
         """
-        day_key = f"day_{day_num}"
+        day_key = _day_key(day_num)
         day_data = self.working_data[day_key]
         max_index = self._total_stories(day_data)
 
@@ -819,41 +924,36 @@ class StoryCurator(StoryCuratorData):
         if raw.lower() == 'back':
             return
 
-        # Parse comma or space separated indices
-        parts = raw.replace(',', ' ').split()
-        try:
-            indices = [int(p) for p in parts]
-        except ValueError:
-            console.print("[red]Invalid input — enter numbers separated by commas or spaces[/red]")
-            return
-
-        if len(indices) < 2:
-            console.print("[red]Need at least 2 stories to combine[/red]")
-            return
-
-        # Validate indices
-        for idx in indices:
-            if idx < 1 or idx > max_index:
+        # Parse, validate and gather comma or space separated indices in one pass
+        seen = set()
+        selected = []
+        for part in raw.replace(',', ' ').split():
+            if not part.isdecimal():
+                console.print("[red]Invalid input — enter numbers separated by commas or spaces[/red]")
+                return
+            idx = int(part)
+            if not 1 <= idx <= max_index:
                 console.print(f"[red]Story {idx} not found (valid: 1-{max_index})[/red]")
                 return
+            if idx in seen:
+                console.print("[red]Duplicate story numbers[/red]")
+                return
+            seen.add(idx)
 
-        if len(set(indices)) != len(indices):
-            console.print("[red]Duplicate story numbers[/red]")
-            return
-
-        # Gather selected stories
-        selected = []
-        for idx in indices:
             story, slot_type = self._get_story_by_index(day_data, idx)
             if story is None:
                 console.print(f"[red]Story {idx} not found[/red]")
                 return
             selected.append((idx, story, slot_type))
 
+        if len(selected) < 2:
+            console.print("[red]Need at least 2 stories to combine[/red]")
+            return
+
         # Confirm
         console.print("\n[bold]Combine these stories?[/bold]")
         for idx, story, slot_type in selected:
-            title = story.get('tui_headline') or story.get('title', 'Untitled')[:60]
+            title = _display_title(story)
             console.print(f"  [{idx}] {title}")
 
         confirm = console.input("\nCombine? [Y/n]: ").strip().lower()
@@ -865,23 +965,15 @@ class StoryCurator(StoryCuratorData):
         titles = [s.get('title', '') for _, s, _ in selected]
         contents = [s.get('content', '') for _, s, _ in selected]
 
-        # Collect all source URLs (deduped, order-preserving)
-        all_source_urls = []
-        seen_urls = set()
-        for _, s, _ in selected:
-            url = s.get('source_url', '')
-            if url and url not in seen_urls:
-                all_source_urls.append(url)
-                seen_urls.add(url)
+        # Collect all source URLs (deduped, order-preserving via dict keys)
+        all_source_urls = list(dict.fromkeys(
+            url for _, s, _ in selected if (url := s.get('source_url', ''))
+        ))
 
         # Merge all_urls from each story
-        merged_all_urls = []
-        seen_all = set()
-        for _, s, _ in selected:
-            for u in s.get('all_urls', []):
-                if u not in seen_all:
-                    merged_all_urls.append(u)
-                    seen_all.add(u)
+        merged_all_urls = list(dict.fromkeys(
+            u for _, s, _ in selected for u in s.get('all_urls', [])
+        ))
 
         first_title_short = (selected[0][1].get('tui_headline')
                              or selected[0][1].get('title', 'Story'))[:30]
@@ -898,11 +990,11 @@ class StoryCurator(StoryCuratorData):
 
         # Determine where to place the combined story
         has_main_selected = any(st == 'main' for _, _, st in selected)
-        first_idx = indices[0]
+        first_idx = selected[0][0]
 
         # Remove originals in reverse index order to avoid shift issues
-        has_second = self._has_second_story(day_data)
         mini_start = self._mini_start_index(day_data)
+        minis = day_data.setdefault('mini_articles', [])
 
         for idx, _, slot_type in sorted(selected, key=lambda x: x[0], reverse=True):
             if slot_type == 'main':
@@ -911,8 +1003,8 @@ class StoryCurator(StoryCuratorData):
                 day_data['second_story'] = {}
             else:
                 mini_idx = idx - mini_start
-                if 0 <= mini_idx < len(day_data.get('mini_articles', [])):
-                    day_data['mini_articles'].pop(mini_idx)
+                if 0 <= mini_idx < len(minis):
+                    minis.pop(mini_idx)
 
         # Insert combined story
         if has_main_selected:
@@ -920,7 +1012,6 @@ class StoryCurator(StoryCuratorData):
         else:
             # Insert at position of first selected story (as a mini)
             # Recalculate mini position after removals
-            minis = day_data.get('mini_articles', [])
             # Place at start of minis if first_idx was near the top, else append
             new_mini_start = self._mini_start_index(day_data)
             insert_pos = max(0, first_idx - new_mini_start)
@@ -930,14 +1021,14 @@ class StoryCurator(StoryCuratorData):
         # Clean up empty second_story if it was combined away
         if 'second_story' in day_data and not day_data['second_story'].get('title'):
             # If second_story is now empty, promote first mini if available
-            if day_data.get('mini_articles'):
-                day_data['second_story'] = day_data['mini_articles'].pop(0)
+            if minis:
+                day_data['second_story'] = minis.pop(0)
             else:
                 del day_data['second_story']
 
         # Record change
         change_msg = f"Day {day_num}: Combined {len(selected)} stories → '{combined['tui_headline']}'"
-        self.changes_made.append(change_msg)
+        self._record_change(change_msg)
         console.print(f"\n[green]✓[/green] {change_msg}")
 
         # Auto-save
@@ -955,6 +1046,7 @@ class StoryCurator(StoryCuratorData):
 
         xkcd_manager = XkcdManager()
         cache = xkcd_manager.load_cache()
+        themes = {day: get_theme_name(day) for day in range(1, 5)}
 
         # Check if already selected for this week
         existing = xkcd_manager.get_week_selections()
@@ -967,9 +1059,9 @@ class StoryCurator(StoryCuratorData):
                 if comic_num:
                     comic = cache.get(str(comic_num), {})
                     title = comic.get("title", "Unknown")
-                    console.print(f"  Day {day} ({get_theme_name(day)}): #{comic_num} \"{title}\"")
+                    console.print(f"  Day {day} ({themes[day]}): #{comic_num} \"{title}\"")
                 else:
-                    console.print(f"  Day {day} ({get_theme_name(day)}): [dim]not selected[/dim]")
+                    console.print(f"  Day {day} ({themes[day]}): [dim]not selected[/dim]")
             console.print()
 
             choice = console.input("Keep current selections? [Y/n]: ").strip().lower()
@@ -1002,33 +1094,32 @@ class StoryCurator(StoryCuratorData):
         # Build dict of day -> comic data for review
         selections = {}
         for day, comic_num in auto_selections.items():
-            comic = cache.get(str(comic_num), {})
-            selections[day] = {
-                "num": comic_num,
-                "title": comic.get("title", "Unknown"),
-                "summary": comic.get("analysis", {}).get("brief_summary", ""),
-                "url": f"https://xkcd.com/{comic_num}/"
-            }
+            selections[day] = _xkcd_selection(comic_num, cache.get(str(comic_num), {}))
+
+        # Comic numbers currently picked, kept in step with each replacement
+        used_nums = {sel["num"] for sel in selections.values()}
 
         # Review loop - let user approve or veto each
         console.print("[bold]Computer picked these 4 comics:[/bold]\n")
 
+        # Show all 4 the first time; afterwards only reprint the day a veto
+        # replaced, plus a one-line options reminder
+        show_all = True
+        changed_day = None
         reviewing = True
         while reviewing:
-            # Display all 4
-            for day in range(1, 5):
-                sel = selections[day]
-                console.print(f"  Day {day} ({get_theme_name(day)}): #{sel['num']} \"{sel['title']}\"")
-                if sel['summary']:
-                    console.print(f"         [dim]{sel['summary']}[/dim]")
-                console.print(f"         [dim]{sel['url']}[/dim]")
-            console.print()
-
-            console.print("[bold]Options:[/bold]")
-            console.print("  [A] Accept all - looks good!")
-            console.print("  [1-4] Veto comic for that day (pick a different one)")
-            console.print("  [S] Skip xkcd for this week")
-            console.print()
+            lines = []
+            if show_all:
+                for day in range(1, 5):
+                    lines.extend(_xkcd_pick_lines(day, themes[day], selections[day]))
+                lines.append(_XKCD_OPTIONS)
+                show_all = False
+            else:
+                if changed_day is not None:
+                    lines.extend(_xkcd_pick_lines(changed_day, themes[changed_day], selections[changed_day]))
+                lines.append(_XKCD_OPTIONS_SHORT)
+            changed_day = None
+            console.print("\n".join(lines))
 
             choice = console.input("[cyan]Choice:[/cyan] ").strip().lower()
 
@@ -1038,7 +1129,7 @@ class StoryCurator(StoryCuratorData):
                 xkcd_manager.save_week_selections(final_selections)
                 console.print("\n[green]✓[/green] Saved all 4 comics!")
                 for day in range(1, 5):
-                    self.changes_made.append(
+                    self._record_change(
                         f"xkcd #{selections[day]['num']} selected for Day {day}"
                     )
                 reviewing = False
@@ -1049,11 +1140,11 @@ class StoryCurator(StoryCuratorData):
 
             elif choice in ['1', '2', '3', '4']:
                 veto_day = int(choice)
+                changed_day = veto_day
                 vetoed_num = selections[veto_day]["num"]
                 console.print(f"\n[yellow]Vetoed #{vetoed_num} for Day {veto_day}[/yellow]")
 
                 # Get replacement options (exclude already selected comics)
-                used_nums = {sel["num"] for sel in selections.values()}
                 replacement_candidates = [
                     c for c in candidates
                     if c["num"] not in used_nums
@@ -1061,6 +1152,7 @@ class StoryCurator(StoryCuratorData):
 
                 if not replacement_candidates:
                     console.print("[red]No more candidates available![/red]")
+                    changed_day = None
                     continue
 
                 # Show options: auto-pick or manual pick
@@ -1074,12 +1166,7 @@ class StoryCurator(StoryCuratorData):
 
                 if replace_choice == 'a':
                     # Use auto-pick
-                    selections[veto_day] = {
-                        "num": auto_pick["num"],
-                        "title": auto_pick.get("title", "Unknown"),
-                        "summary": auto_pick.get("analysis", {}).get("brief_summary", ""),
-                        "url": f"https://xkcd.com/{auto_pick['num']}/"
-                    }
+                    selections[veto_day] = _xkcd_selection(auto_pick["num"], auto_pick)
                     console.print(f"[green]✓[/green] Replaced with #{auto_pick['num']}\n")
 
                 elif replace_choice == 'm':
@@ -1093,47 +1180,29 @@ class StoryCurator(StoryCuratorData):
                             console.print(f"      [dim]{summary}[/dim]")
 
                     pick = console.input(f"\nPick (1-{min(10, len(replacement_candidates))}): ").strip()
-                    try:
-                        pick_idx = int(pick) - 1
-                        if 0 <= pick_idx < len(replacement_candidates):
-                            picked = replacement_candidates[pick_idx]
-                            selections[veto_day] = {
-                                "num": picked["num"],
-                                "title": picked.get("title", "Unknown"),
-                                "summary": picked.get("analysis", {}).get("brief_summary", ""),
-                                "url": f"https://xkcd.com/{picked['num']}/"
-                            }
-                            console.print(f"[green]✓[/green] Selected #{picked['num']}\n")
-                        else:
-                            console.print("[yellow]Invalid choice, keeping auto-pick[/yellow]")
-                            selections[veto_day] = {
-                                "num": auto_pick["num"],
-                                "title": auto_pick.get("title", "Unknown"),
-                                "summary": auto_pick.get("analysis", {}).get("brief_summary", ""),
-                                "url": f"https://xkcd.com/{auto_pick['num']}/"
-                            }
-                    except ValueError:
-                        console.print("[yellow]Invalid input, keeping auto-pick[/yellow]")
-                        selections[veto_day] = {
-                            "num": auto_pick["num"],
-                            "title": auto_pick.get("title", "Unknown"),
-                            "summary": auto_pick.get("analysis", {}).get("brief_summary", ""),
-                            "url": f"https://xkcd.com/{auto_pick['num']}/"
-                        }
+                    pick_num = self._parse_int_in_range(pick, 1, len(replacement_candidates))
+                    if pick_num is not None:
+                        picked = replacement_candidates[pick_num - 1]
+                        console.print(f"[green]✓[/green] Selected #{picked['num']}\n")
+                    else:
+                        console.print("[yellow]Invalid choice, keeping auto-pick[/yellow]")
+                        picked = auto_pick
+                    selections[veto_day] = _xkcd_selection(picked["num"], picked)
 
                 elif replace_choice == 'r':
                     # Reject the comic and use auto-pick
                     self._handle_single_reject(xkcd_manager, vetoed_num)
-                    selections[veto_day] = {
-                        "num": auto_pick["num"],
-                        "title": auto_pick.get("title", "Unknown"),
-                        "summary": auto_pick.get("analysis", {}).get("brief_summary", ""),
-                        "url": f"https://xkcd.com/{auto_pick['num']}/"
-                    }
+                    selections[veto_day] = _xkcd_selection(auto_pick["num"], auto_pick)
                     console.print(f"[green]✓[/green] Rejected #{vetoed_num}, replaced with #{auto_pick['num']}\n")
 
                 else:
                     console.print("[dim]Cancelled veto[/dim]\n")
+                    changed_day = None
+
+                new_num = selections[veto_day]["num"]
+                if new_num != vetoed_num:
+                    used_nums.discard(vetoed_num)
+                    used_nums.add(new_num)
 
             else:
                 console.print("[yellow]Invalid choice[/yellow]\n")
@@ -1159,18 +1228,17 @@ class StoryCurator(StoryCuratorData):
         # Analyze any new comics
         all_comics = recent + old
         rejected = xkcd_manager.load_rejected()
+        already_analyzed = {num for num, cached in xkcd_manager.load_cache().items() if "analysis" in cached}
         analyzed_count = 0
 
         for comic in all_comics:
             comic_num = str(comic["num"])
-            if comic_num in rejected:
-                continue
-            cache = xkcd_manager.load_cache()
-            if comic_num in cache and "analysis" in cache[comic_num]:
+            if comic_num in rejected or comic_num in already_analyzed:
                 continue
             console.print(f"[dim]  Analyzing #{comic['num']}: {comic['title']}...[/dim]")
             try:
                 xkcd_manager.analyze_comic(comic)
+                already_analyzed.add(comic_num)
                 analyzed_count += 1
             except Exception as e:
                 console.print(f"[red]    Error: {e}[/red]")
@@ -1180,24 +1248,18 @@ class StoryCurator(StoryCuratorData):
 
     def _handle_single_reject(self, xkcd_manager: XkcdManager, comic_num: int) -> None:
         """Quick reject a single comic with reason prompt."""
-        console.print("\nRejection reason:")
-        console.print("  [1] too_complex")
-        console.print("  [2] adult_humor")
-        console.print("  [3] too_dark")
-        console.print("  [4] multi_panel")
-        console.print("  [5] requires_context")
-        console.print("  [6] other")
+        reasons = REJECTION_REASONS
+        console.print("\nRejection reason:\n" + "\n".join(
+            f"  [{i}] {reason}" for i, reason in enumerate(reasons, 1)
+        ))
 
-        reason_choice = console.input("\nReason (1-6): ").strip()
+        reason_choice = console.input(f"\nReason (1-{len(reasons)}): ").strip()
 
-        reasons = ["too_complex", "adult_humor", "too_dark", "multi_panel", "requires_context", "other"]
-        try:
-            reason_idx = int(reason_choice) - 1
-            if 0 <= reason_idx < len(reasons):
-                reason = reasons[reason_idx]
-                xkcd_manager.reject_comic(comic_num, reason)
-                self.changes_made.append(f"xkcd #{comic_num} rejected ({reason})")
-            else:
-                console.print("[dim]Invalid reason, skipping rejection[/dim]")
-        except ValueError:
-            console.print("[dim]Invalid input, skipping rejection[/dim]")
+        reason_num = self._parse_int_in_range(reason_choice, 1, len(reasons))
+        if reason_num is None:
+            console.print("[dim]Invalid reason, skipping rejection[/dim]")
+            return
+
+        reason = reasons[reason_num - 1]
+        xkcd_manager.reject_comic(comic_num, reason)
+        self._record_change(f"xkcd #{comic_num} rejected ({reason})")
@@ -9,14 +9,51 @@ mutating, validating, and saving curated story data. TUI/interactive
 methods are in curator.py (StoryCurator subclass).
 """
 
-import json
-import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
+import orjson
 from rich.console import Console
 from utils import get_theme_name
 
+_DAY_KEYS = tuple(f"day_{day_num}" for day_num in range(1, 5))
+_DAY_KEY_SET = frozenset(_DAY_KEYS)
+
+
+def _day_key(day_num: int) -> str:
+    """Get the working_data key for a day number ('day_1' .. 'day_4')."""
+    if 1 <= day_num <= 4:
+        return _DAY_KEYS[day_num - 1]
+    return f"day_{day_num}"
+
+
+def _display_title(story: Dict, width: int = 60) -> str:
+    """Get a story's TUI label: its tui_headline, else its title cut to width."""
+    return story.get('tui_headline') or (story.get('title') or 'Untitled')[:width]
+
+# OPT_NON_STR_KEYS: theme_metadata may be keyed by int day numbers
+_JSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
+def _write_json_atomic(output_file, data: Dict, pretty: bool = False) -> None:
+    """Write data as JSON via a sibling temp file and os.replace.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one. Output is compact unless pretty is set.
+    """
+    option = _JSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else _JSON_OPTIONS
+    _write_bytes_atomic(output_file, orjson.dumps(data, option=option))
+
+
+def _write_bytes_atomic(output_file, buf: bytes) -> None:
+    """Write bytes via a sibling temp file and os.replace."""
+    output_file = Path(output_file)
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    tmp_file.write_bytes(buf)
+    os.replace(tmp_file, output_file)
+
 
 def _get_secondary_story_title(day_data: Dict) -> Optional[str]:
     """Get a secondary story title from front_page_stories or mini_articles."""
@@ -33,13 +70,27 @@ def _get_secondary_story_title(day_data: Dict) -> Optional[str]:
     return None
 
 
-def generate_teasers_for_curated_data(curated_data: Dict, console: Console = None) -> Dict:
+def _load_teaser_cache(cache_file: Optional[Path]) -> Dict:
+    """Load the teaser cache, or an empty one if it is missing or unreadable."""
+    if cache_file is None:
+        return {}
+    try:
+        return orjson.loads(Path(cache_file).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def generate_teasers_for_curated_data(
+    curated_data: Dict, console: Console = None, cache_file: Optional[Path] = None
+) -> Dict:
     """
     Generate tomorrow teasers for days 1-3 based on next day's content.
 
     Args:
         curated_data: Dict with day_1 through day_4 keys
         console: Optional Rich Console for output
+        cache_file: Optional JSON file of teasers keyed by (theme, main title,
+            secondary title); hits skip the API call, misses are added
 
     Returns:
         Modified curated_data with populated tomorrow_teaser fields
@@ -49,11 +100,11 @@ def generate_teasers_for_curated_data(curated_data: Dict, console: Console = Non
     if console is None:
         console = Console()
 
-    generator = ContentGenerator()
+    cache = _load_teaser_cache(cache_file)
+    cache_updated = False
+    pending = []  # (day_num, current_day, cache_key, generate_teaser kwargs)
 
-    for day_num in [1, 2, 3]:
-        current_day = f"day_{day_num}"
-        tomorrow_day = f"day_{day_num + 1}"
+    for day_num, (current_day, tomorrow_day) in enumerate(zip(_DAY_KEYS, _DAY_KEYS[1:]), 1):
 
         # Skip if current day doesn't exist
         if current_day not in curated_data:
@@ -69,17 +120,49 @@ def generate_teasers_for_curated_data(curated_data: Dict, console: Console = Non
         main_title = main_story.get("tui_headline") or main_story.get("title")
         secondary_title = _get_secondary_story_title(tomorrow)
 
-        # Generate teaser
+        tomorrow_theme = tomorrow.get("theme", get_theme_name(day_num + 1))
+        cache_key = orjson.dumps([tomorrow_theme, main_title, secondary_title]).decode()
+        if cache_key in cache:
+            curated_data[current_day]["tomorrow_teaser"] = cache[cache_key]
+            continue
+
+        pending.append((day_num, current_day, cache_key, {
+            "tomorrow_theme": tomorrow_theme,
+            "main_title": main_title,
+            "secondary_title": secondary_title,
+        }))
+
+    # Only cache misses need a client; the teasers are independent API
+    # round-trips, so issue them all at once
+    generator = None
+    if pending:
         try:
-            teaser = generator.generate_teaser(
-                tomorrow_theme=tomorrow.get("theme", get_theme_name(day_num + 1)),
-                main_title=main_title,
-                secondary_title=secondary_title
-            )
-            curated_data[current_day]["tomorrow_teaser"] = teaser
+            generator = ContentGenerator()
         except Exception as e:
-            console.print(f"[yellow]Warning: Failed to generate teaser for day {day_num}: {e}[/yellow]")
-            # Leave teaser empty on failure
+            for day_num, *_ in pending:
+                console.print(f"[yellow]Warning: Failed to generate teaser for day {day_num}: {e}[/yellow]")
+
+    if generator is not None:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = [
+                (day_num, current_day, cache_key, executor.submit(generator.generate_teaser, **kwargs))
+                for day_num, current_day, cache_key, kwargs in pending
+            ]
+            for day_num, current_day, cache_key, future in futures:
+                try:
+                    teaser = future.result()
+                    curated_data[current_day]["tomorrow_teaser"] = teaser
+                    cache[cache_key] = teaser
+                    cache_updated = True
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Failed to generate teaser for day {day_num}: {e}[/yellow]")
+                    # Leave teaser empty on failure
+
+    if cache_updated and cache_file is not None:
+        try:
+            _write_json_atomic(cache_file, cache)
+        except OSError as e:
+            console.print(f"[dim][Teaser cache write failed: {e}][/dim]")
 
     return curated_data
 
@@ -100,29 +183,37 @@ class StoryCuratorData:
         self.json_file = Path(json_file)
         self.output_file = output_file
         self.console = console or Console()
-        self.original_data = self._load_json(self.json_file)
-        self.working_data = copy.deepcopy(self.original_data)
+        self.working_data = self._load_json(self.json_file)
         self.changes_made = []
+        # Bytes of the last auto-save, to skip rewriting an unchanged file
+        self._last_saved: Optional[bytes] = None
+
+    def load_original(self) -> Dict:
+        """Re-read and parse the input JSON file.
+
+        Nothing is kept in memory for this, so loading doesn't pay for a
+        second copy that most sessions never use. The result reflects the
+        file as it is now on disk.
+        """
+        return orjson.loads(self.json_file.read_bytes())
 
     def _load_json(self, json_file: Path) -> Dict:
         """Load JSON file and validate structure."""
-        if not json_file.exists():
-            raise FileNotFoundError(f"JSON file not found: {json_file}")
-
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        try:
+            data = orjson.loads(json_file.read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file not found: {json_file}") from None
 
         # Validate structure
-        for day_num in range(1, 5):
-            day_key = f"day_{day_num}"
-            if day_key not in data:
-                self.console.print(f"[yellow]Warning: {day_key} not found in JSON[/yellow]")
+        missing = _DAY_KEY_SET - data.keys()
+        if missing:
+            self.console.print(f"[yellow]Warning: {', '.join(sorted(missing))} not found in JSON[/yellow]")
 
         return data
 
     def _day_theme(self, day_num: int) -> str:
         """Get the live theme name for a day from working data."""
-        day_key = f"day_{day_num}"
+        day_key = _day_key(day_num)
         if day_key in self.working_data:
             return self.working_data[day_key].get('theme', get_theme_name(day_num))
         return get_theme_name(day_num)
@@ -144,6 +235,34 @@ class StoryCuratorData:
         count += len(day_data.get('mini_articles', []))
         return count
 
+    def _day_fill(self, day_data: Dict) -> tuple[int, int]:
+        """Get (stories placed, capacity) for a day: 5 slots, 6 with a second main story."""
+        has_second = self._has_second_story(day_data)
+        count = len(day_data.get('mini_articles') or ()) + (1 if day_data.get('main_story') else 0)
+        if has_second:
+            return count + 1, 6
+        return count, 5
+
+    def _record_change(self, change_msg: str) -> None:
+        """Record a change for the session summary and the on-disk change log.
+
+        The log sits next to the output file ('<output>.changes.log', one JSON
+        object per line) so the edit history survives a crash; it is skipped
+        when there is no output file.
+        """
+        self.changes_made.append(change_msg)
+
+        if self.output_file is None:
+            return
+
+        entry = orjson.dumps({'at': datetime.now().isoformat(timespec='seconds'), 'change': change_msg})
+        log_path = Path(self.output_file).with_suffix('.changes.log')
+        try:
+            with open(log_path, 'ab') as f:
+                f.write(entry + b"\n")
+        except OSError as e:
+            self.console.print(f"[dim][Change log write failed: {e}][/dim]")
+
     def _auto_save(self) -> None:
         """Auto-save working data after each change (if output file is set)."""
         if self.output_file is None:
@@ -153,8 +272,11 @@ class StoryCuratorData:
         output_data = {k: v for k, v in self.working_data.items() if k != 'unused'}
 
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            buf = orjson.dumps(output_data, option=_JSON_OPTIONS)
+            if buf == self._last_saved:
+                return
+            _write_bytes_atomic(self.output_file, buf)
+            self._last_saved = buf
         except Exception as e:
             self.console.print(f"[dim][Auto-save failed: {e}][/dim]")
 
@@ -188,7 +310,7 @@ class StoryCuratorData:
             day_num: Day number (1-4)
             new_main_index: Story index to make main (1-based, 2+ = currently minis)
         """
-        day_key = f"day_{day_num}"
+        day_key = _day_key(day_num)
         if day_key not in self.working_data:
             self.console.print(f"[red]Error: {day_key} not found[/red]")
             return
@@ -222,7 +344,7 @@ class StoryCuratorData:
 
         # Record change
         change_msg = f"Day {day_num}: Swapped main story"
-        self.changes_made.append(change_msg)
+        self._record_change(change_msg)
 
         self.console.print(f"[green]✓[/green] {change_msg}")
         self.console.print(f"  New main: {new_main.get('title', 'Untitled')[:50]}...")
@@ -245,6 +367,7 @@ class StoryCuratorData:
         """
         has_second = self._has_second_story(from_data)
         mini_start = self._mini_start_index(from_data)
+        minis = from_data.get('mini_articles', [])
 
         # Determine slot type
         if story_index == 1:
@@ -254,7 +377,6 @@ class StoryCuratorData:
             story = from_data.get('second_story', {})
             slot_type = 'second'
         else:
-            minis = from_data.get('mini_articles', [])
             mini_idx = story_index - mini_start
             if mini_idx < 0 or mini_idx >= len(minis):
                 self.console.print(f"[red]Error: Story {story_index} not found[/red]")
@@ -266,8 +388,8 @@ class StoryCuratorData:
         if slot_type == 'main':
             if has_second:
                 from_data['main_story'] = from_data.pop('second_story')
-            elif from_data.get('mini_articles'):
-                from_data['main_story'] = from_data['mini_articles'].pop(0)
+            elif minis:
+                from_data['main_story'] = minis.pop(0)
             else:
                 self.console.print(f"[yellow]⚠️  Warning: Day {from_day} will have no main story after this move[/yellow]")
                 self.console.print(f"[dim]   (This will cause validation to fail when saving)[/dim]")
@@ -275,8 +397,7 @@ class StoryCuratorData:
         elif slot_type == 'second':
             from_data['second_story'] = {}
         else:
-            mini_idx = story_index - mini_start
-            from_data['mini_articles'].pop(mini_idx)
+            minis.pop(story_index - mini_start)
 
         return story, slot_type
 
@@ -292,8 +413,8 @@ class StoryCuratorData:
         Returns:
             True if move succeeded, False if cancelled/failed
         """
-        from_key = f"day_{from_day}"
-        to_key = f"day_{to_day}"
+        from_key = _day_key(from_day)
+        to_key = _day_key(to_day)
 
         if from_key not in self.working_data or to_key not in self.working_data:
             self.console.print("[red]Error: Invalid day number[/red]")
@@ -301,82 +422,48 @@ class StoryCuratorData:
 
         from_data = self.working_data[from_key]
         to_data = self.working_data[to_key]
-        has_second = self._has_second_story(from_data)
-        mini_start = self._mini_start_index(from_data)
-
-        # Get story to move and determine its slot type
-        slot_type = None  # 'main', 'second', or 'mini'
-        if story_index == 1:
-            story = from_data.get('main_story', {})
-            slot_type = 'main'
-        elif story_index == 2 and has_second:
-            story = from_data.get('second_story', {})
-            slot_type = 'second'
-        else:
-            minis = from_data.get('mini_articles', [])
-            mini_idx = story_index - mini_start
-            if mini_idx < 0 or mini_idx >= len(minis):
-                self.console.print(f"[red]Error: Story {story_index} not found[/red]")
-                return False
-            story = minis[mini_idx]
-            slot_type = 'mini'
+        story, slot_type = self._get_story_by_index(from_data, story_index)
+        if story is None:
+            self.console.print(f"[red]Error: Story {story_index} not found[/red]")
+            return False
 
         # Check if target day is full (up to 2 main + 4 minis = 6 total)
-        to_minis = to_data.get('mini_articles', [])
-        to_has_main = bool(to_data.get('main_story'))
-        to_has_second = self._has_second_story(to_data)
-        to_count = len(to_minis) + (1 if to_has_main else 0) + (1 if to_has_second else 0)
-        to_max = 6 if to_has_second else 5
-
-        # Remove from source day first
-        if slot_type == 'main':
-            # If moving main story, promote second story or first mini
-            if has_second:
-                from_data['main_story'] = from_data.pop('second_story')
-            elif from_data.get('mini_articles'):
-                from_data['main_story'] = from_data['mini_articles'].pop(0)
-            else:
-                self.console.print(f"[yellow]⚠️  Warning: Day {from_day} will have no main story after this move[/yellow]")
-                self.console.print(f"[dim]   (This will cause validation to fail when saving)[/dim]")
-                from_data['main_story'] = {}
-        elif slot_type == 'second':
-            from_data['second_story'] = {}
-        else:
-            from_data['mini_articles'].pop(mini_idx)
+        to_count, to_max = self._day_fill(to_data)
 
         if to_count >= to_max:
             # Handle overflow (swap or replace) — delegated to TUI layer
-            swapped_story = self._handle_overflow(to_day, story)
+            outcome, swapped_story = self._handle_overflow(to_day, story)
 
-            if swapped_story is None:
-                # User cancelled or chose replace (no story to add back)
-                # Story removed from source day (already done above)
+            if outcome == 'cancel':
                 return True
 
-            # User chose swap - add swapped story to source day
+            if outcome == 'replace':
+                # Replace put the story into the target day, so take it out
+                # of the source
+                self._remove_story_from_day(from_data, story_index, from_day)
+                return True
+
+            # User chose swap - the swapped story takes the moved story's slot
             if slot_type == 'main':
-                # Source lost its main, make swapped story the main
                 from_data['main_story'] = swapped_story
             elif slot_type == 'second':
-                # Source lost its second story, put swapped story there
                 from_data['second_story'] = swapped_story
             else:
-                # Add swapped story as mini
-                if 'mini_articles' not in from_data:
-                    from_data['mini_articles'] = []
-                from_data['mini_articles'].insert(mini_idx, swapped_story)
+                mini_idx = story_index - self._mini_start_index(from_data)
+                from_data['mini_articles'][mini_idx] = swapped_story
 
             return True
 
+        # Remove from source day
+        self._remove_story_from_day(from_data, story_index, from_day)
+
         # Add to target day as mini article
-        if 'mini_articles' not in to_data:
-            to_data['mini_articles'] = []
-        to_data['mini_articles'].append(story)
+        to_data.setdefault('mini_articles', []).append(story)
 
         # Record change
-        story_title = story.get('tui_headline') or story.get('title', 'Untitled')[:40]
+        story_title = _display_title(story, 40)
         change_msg = f"Day {from_day} → Day {to_day}: {story_title}"
-        self.changes_made.append(change_msg)
+        self._record_change(change_msg)
 
         self.console.print(f"[green]✓[/green] Moved: {story_title}")
         self.console.print(f"  From: Day {from_day} → To: Day {to_day} (mini)")
@@ -386,11 +473,11 @@ class StoryCuratorData:
 
         return True
 
-    def _handle_overflow(self, to_day: int, incoming_story: dict) -> Optional[dict]:
+    def _handle_overflow(self, to_day: int, incoming_story: dict) -> tuple[str, Optional[dict]]:
         """
         Handle adding story to a full day (5 stories already).
 
-        Default implementation prints a warning and returns None (cancel).
+        Default implementation prints a warning and cancels.
         Override in TUI subclass for interactive swap/replace behavior.
 
         Args:
@@ -398,10 +485,12 @@ class StoryCuratorData:
             incoming_story: Story being moved
 
         Returns:
-            Story to swap back to source day, or None if cancelled/replaced
+            (outcome, swapped_story): outcome is 'cancel', 'replace' or 'swap';
+            swapped_story is the story to put back in the source day on a
+            swap, else None
         """
         self.console.print(f"[yellow]⚠️  Day {to_day} is full. Move cancelled.[/yellow]")
-        return None
+        return 'cancel', None
 
     def move_to_unused(self, from_day: int, story_index: int) -> None:
         """
@@ -411,55 +500,22 @@ class StoryCuratorData:
             from_day: Source day number (1-4)
             story_index: Story index in source day (1-based)
         """
-        from_key = f"day_{from_day}"
+        from_key = _day_key(from_day)
         if from_key not in self.working_data:
             self.console.print("[red]Error: Invalid day number[/red]")
             return
 
         from_data = self.working_data[from_key]
-        has_second = self._has_second_story(from_data)
-        mini_start = self._mini_start_index(from_data)
-
-        # Get story to move
-        slot_type = None
-        if story_index == 1:
-            story = from_data.get('main_story', {})
-            slot_type = 'main'
-        elif story_index == 2 and has_second:
-            story = from_data.get('second_story', {})
-            slot_type = 'second'
-        else:
-            minis = from_data.get('mini_articles', [])
-            mini_idx = story_index - mini_start
-            if mini_idx < 0 or mini_idx >= len(minis):
-                self.console.print(f"[red]Error: Story {story_index} not found[/red]")
-                return
-            story = minis[mini_idx]
-            slot_type = 'mini'
-
-        # Remove from source day
-        if slot_type == 'main':
-            if has_second:
-                from_data['main_story'] = from_data.pop('second_story')
-            elif from_data.get('mini_articles'):
-                from_data['main_story'] = from_data['mini_articles'].pop(0)
-            else:
-                self.console.print(f"[yellow]⚠️  Warning: Day {from_day} will have no main story after this move[/yellow]")
-                self.console.print(f"[dim]   (This will cause validation to fail when saving)[/dim]")
-                from_data['main_story'] = {}
-        elif slot_type == 'second':
-            from_data['second_story'] = {}
-        else:
-            from_data['mini_articles'].pop(mini_idx)
+        story, _ = self._remove_story_from_day(from_data, story_index, from_day)
+        if story is None:
+            return
 
         # Add to unused
-        if 'unused' not in self.working_data:
-            self.working_data['unused'] = {'stories': []}
-        self.working_data['unused']['stories'].append(story)
+        self.working_data.setdefault('unused', {'stories': []})['stories'].append(story)
 
-        story_title = story.get('tui_headline') or story.get('title', 'Untitled')[:40]
+        story_title = _display_title(story, 40)
         change_msg = f"Day {from_day} → Unused: {story_title}"
-        self.changes_made.append(change_msg)
+        self._record_change(change_msg)
 
         self.console.print(f"[green]✓[/green] Moved to unused: {story_title}")
         self.console.print(f"  Story removed from newspaper")
@@ -489,7 +545,7 @@ class StoryCuratorData:
             self.console.print(f"[red]Error: Invalid day number {to_day}[/red]")
             return
 
-        to_key = f"day_{to_day}"
+        to_key = _day_key(to_day)
 
         # Create target day if it doesn't exist
         if to_key not in self.working_data:
@@ -508,20 +564,14 @@ class StoryCuratorData:
         to_data = self.working_data[to_key]
 
         # Check if target day is full - warn but allow
-        to_minis = to_data.get('mini_articles', [])
-        to_has_main = bool(to_data.get('main_story'))
-        to_has_second = self._has_second_story(to_data)
-        to_count = len(to_minis) + (1 if to_has_main else 0) + (1 if to_has_second else 0)
-        to_max = 6 if to_has_second else 5
+        to_count, to_max = self._day_fill(to_data)
 
         # Add to target day as mini article
-        if 'mini_articles' not in to_data:
-            to_data['mini_articles'] = []
-        to_data['mini_articles'].append(story)
+        to_data.setdefault('mini_articles', []).append(story)
 
-        story_title = story.get('tui_headline') or story.get('title', 'Untitled')[:40]
+        story_title = _display_title(story, 40)
         change_msg = f"Unused → Day {to_day}: {story_title}"
-        self.changes_made.append(change_msg)
+        self._record_change(change_msg)
 
         self.console.print(f"[green]✓[/green] Moved from unused: {story_title}")
         self.console.print(f"  Added to Day {to_day} (mini)")
@@ -542,18 +592,17 @@ class StoryCuratorData:
         Returns:
             True if valid, False if critical errors found
         """
-        valid = True
+        errors = []
         warnings = []
 
-        for day_num in range(1, 5):
-            day_key = f"day_{day_num}"
-            if day_key not in self.working_data:
+        for day_num, day_key in enumerate(_DAY_KEYS, 1):
+            day_data = self.working_data.get(day_key)
+            if day_data is None:
                 warnings.append(f"Day {day_num} not found in data")
                 continue
 
-            day_data = self.working_data[day_key]
-            main_story = day_data.get('main_story', {})
-            mini_articles = day_data.get('mini_articles', [])
+            main_story = day_data.get('main_story')
+            mini_articles = day_data.get('mini_articles') or ()
 
             # Check for empty day
             if not main_story and not mini_articles:
@@ -561,33 +610,36 @@ class StoryCuratorData:
                 continue
 
             # Check for missing main story
-            if not main_story or not main_story.get('title'):
-                self.console.print(f"[red]Error: Day {day_num} has no main story[/red]")
-                valid = False
+            if not (main_story and main_story.get('title')):
+                errors.append(f"Error: Day {day_num} has no main story")
 
-            # Check for no mini articles
+            # Check for no mini articles / too many mini articles
             if not mini_articles:
                 warnings.append(f"Day {day_num} has no mini articles (only main story)")
-
-            # Check for too many mini articles
-            if len(mini_articles) > 4:
+            elif len(mini_articles) > 4:
                 warnings.append(f"Day {day_num} has {len(mini_articles)} mini articles (recommended max: 4)")
 
-        # Show warnings
+        # Report everything at once rather than stopping at the first error,
+        # so all problems can be fixed in one pass
+        if errors:
+            self.console.print("\n".join(f"[red]{error}[/red]" for error in errors))
+
         if warnings:
-            self.console.print("\n[yellow]Validation warnings:[/yellow]")
-            for warning in warnings:
-                self.console.print(f"  ⚠️  {warning}")
+            self.console.print("\n[yellow]Validation warnings:[/yellow]\n" + "\n".join(
+                f"  ⚠️  {warning}" for warning in warnings
+            ))
 
+        valid = not errors
         return valid
 
-    def save_curated(self, output_file: Path, generate_teasers: bool = True) -> None:
+    def save_curated(self, output_file: Path, generate_teasers: bool = True, pretty: bool = False) -> None:
         """
         Save working_data to new JSON file (excluding unused stories).
 
         Args:
             output_file: Path to save curated JSON
             generate_teasers: Whether to generate tomorrow teasers (default True)
+            pretty: Indent the JSON for human reading (default compact)
         """
         # Create output data without unused category
         output_data = {k: v for k, v in self.working_data.items() if k != 'unused'}
@@ -596,9 +648,11 @@ class StoryCuratorData:
         if generate_teasers:
             self.console.print("\n[cyan]Generating tomorrow teasers...[/cyan]")
             try:
-                output_data = generate_teasers_for_curated_data(output_data, console=self.console)
-                for day_num in [1, 2, 3]:
-                    day_key = f"day_{day_num}"
+                output_data = generate_teasers_for_curated_data(
+                    output_data, console=self.console,
+                    cache_file=Path(output_file).with_suffix('.teaser_cache.json'),
+                )
+                for day_num, day_key in enumerate(_DAY_KEYS[:3], 1):
                     if day_key in output_data and output_data[day_key].get("tomorrow_teaser"):
                         self.console.print(f"  [green]✨[/green] Day {day_num}: teaser generated")
                     else:
@@ -606,8 +660,7 @@ class StoryCuratorData:
             except Exception as e:
                 self.console.print(f"  [yellow]⚠️  Teaser generation failed: {e}[/yellow]")
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        _write_json_atomic(output_file, output_data, pretty=pretty)
 
         self.console.print(f"\n[green]✓[/green] Saved to: {output_file}")
 
@@ -635,8 +688,7 @@ class StoryCuratorData:
         }
 
         # Update day themes
-        for day_num in range(1, 5):
-            day_key = f"day_{day_num}"
+        for day_num, day_key in enumerate(_DAY_KEYS, 1):
             if day_key in self.working_data:
                 self.working_data[day_key]["theme"] = DEFAULT_THEMES[day_num]["name"]
 
@@ -668,8 +720,7 @@ class StoryCuratorData:
             # Collect all stories from current working_data
             all_stories = []
             story_id = 0
-            for day_num in range(1, 5):
-                day_key = f"day_{day_num}"
+            for day_num, day_key in enumerate(_DAY_KEYS, 1):
                 day_data = self.working_data.get(day_key, {})
 
                 # Main story
@@ -7,6 +7,7 @@
 import sys
 import re
 import json
+import traceback
 from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
@@ -206,7 +207,6 @@ def fetch_ftn_latest(output_dir: str = ".", headless: bool = True, force_login:
 
         except Exception as e:
             print(f"❌ Error: {e}")
-            import traceback
             traceback.print_exc()
             sys.exit(1)
 
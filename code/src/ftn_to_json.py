@@ -10,6 +10,7 @@ import sys
 import json
 import os
 import re
+import traceback
 from pathlib import Path
 from typing import Any
 from anthropic import Anthropic
@@ -1006,7 +1007,6 @@ def main():
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
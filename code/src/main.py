@@ -9,21 +9,20 @@ News, Fixed - Main orchestrator for generating daily newspapers.
 
 import sys
 import os
-import json
 import re
+import pickle
+import hashlib
+import functools
 import subprocess
 import shlex
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 import click
-from generator import ContentGenerator
-from pdf_generator import NewspaperGenerator
+import orjson
 from utils import get_theme_name, get_target_week_monday
-from sports_schedule import DukeBasketballSchedule
-from xkcd import XkcdManager
-from readwise_fetcher import ReadwiseFetcher
-from content_generation import is_family_mode, is_friends_mode, generate_day_content
+from content_generation import get_news_mode, generate_day_content
 
 
 def preview_and_print(pdf_path: Path) -> None:
@@ -87,36 +86,122 @@ def calculate_week_dates(base_date=None):
     monday = get_target_week_monday(base_date)
 
     # Build dict for Mon-Thu (days 1-4)
-    week_dates = {}
-    day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday']
+    day_names = ('Monday', 'Tuesday', 'Wednesday', 'Thursday')
+    date_objs = [monday + timedelta(days=i) for i in range(4)]
 
-    for i in range(4):
-        date_obj = monday + timedelta(days=i)
-        week_dates[i + 1] = {
+    return {
+        i + 1: {
             'date_obj': date_obj,
             'day_name': day_names[i],
             'formatted_date': date_obj.strftime('%B %-d, %Y')  # "October 21, 2025"
         }
+        for i, date_obj in enumerate(date_objs)
+    }
+
+
+def _ftn_cache_dir() -> Path | None:
+    """
+    Get the user-private directory for parsed FTN data, or None if unsafe.
 
-    return week_dates
+    Entries are pickles, so loading one runs code: only trust a directory
+    that we own and that nobody else can write to.
+    """
+    base = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / ".cache")
+    cache_dir = base / "news-fixed" / "ftn-cache"
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.stat(cache_dir)
+    except OSError:
+        return None
+    if st.st_uid != os.getuid() or st.st_mode & 0o022:
+        return None
+    return cache_dir
+
+
+def _ftn_cache_paths(input_file: str) -> tuple[Path, str] | None:
+    """
+    Get the parsed-data cache path for an FTN input file.
+
+    Cache entries are keyed by the file's absolute path, mtime, and size,
+    so editing the input (e.g. re-running curation) invalidates the entry.
+
+    Returns:
+        (cache_path, prefix) where prefix is shared by all entries for this
+        file, or None if there is no safe cache directory
+    """
+    cache_dir = _ftn_cache_dir()
+    if cache_dir is None:
+        return None
+    st = os.stat(input_file)
+    prefix = hashlib.sha256(os.path.abspath(input_file).encode()).hexdigest()[:16]
+    return cache_dir / f"{prefix}-{st.st_mtime_ns}-{st.st_size}.pkl", prefix
 
 
 def load_ftn_data(input_file: str) -> dict:
-    """Load and parse FTN data from JSON file."""
+    """Load and parse FTN data from JSON file, reusing a cached parse if unchanged."""
+    cache = _ftn_cache_paths(input_file)
+
+    if cache is not None:
+        try:
+            with open(cache[0], 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
     try:
-        with open(input_file, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(Path(input_file).read_bytes())
+    except orjson.JSONDecodeError as e:
         click.echo(f"❌ Error parsing input file: {e}")
         sys.exit(1)
 
+    if cache is None:
+        return data
+
+    # Cache is best-effort: a failed write just means parsing again next run
+    cache_path, prefix = cache
+    try:
+        with os.scandir(cache_path.parent) as entries:
+            for entry in entries:
+                if entry.name.startswith(f"{prefix}-") and entry.is_file():
+                    os.unlink(entry.path)
+        tmp_path = cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return data
+
+
+def iter_days(ftn_data: dict, day_nums):
+    """Yield (day_num, day_data) for each requested day present in the FTN data.
+
+    Days missing from the input are reported and skipped.
+
+    Args:
+        ftn_data: Parsed FTN data with day_1..day_4 keys
+        day_nums: Iterable of day numbers (1-4) to yield, in order
+    """
+    for day_num in day_nums:
+        day_key = f"day_{day_num}"
+        day_data = ftn_data.get(day_key)
+        if day_data is None:
+            click.echo(f"⚠️  No data found for {day_key} in input file, skipping...")
+            continue
+        yield day_num, day_data
+
 
 def initialize_generators(no_rewrite: bool) -> tuple:
     """Initialize PDF and optionally AI content generators."""
+    from pdf_generator import NewspaperGenerator
+
     pdf_gen = NewspaperGenerator()
     content_gen = None
 
     if not no_rewrite:
+        from generator import ContentGenerator
+
         try:
             content_gen = ContentGenerator()
         except ValueError as e:
@@ -135,16 +220,24 @@ def generate_content_with_ai(content_gen, day_data: dict, day_num: int) -> dict:
         Dict with keys: main_story, front_page_stories, mini_articles,
         statistics, tomorrow_teaser, second_main_story (None for AI path)
     """
+    from rich.progress import Progress
+
     def cli_progress(msg):
         click.echo(f"  ✍️  {msg}")
 
-    result = generate_day_content(
-        content_gen=content_gen,
-        day_data=day_data,
-        day_num=day_num,
-        mode_default='family',
-        on_progress=cli_progress
-    )
+    # One progress bar for the concurrent mini article rewrites
+    with Progress(transient=True) as progress:
+        task = progress.add_task(
+            "  ✍️  Mini articles", total=len(day_data.get('mini_articles', []))
+        )
+        result = generate_day_content(
+            content_gen=content_gen,
+            day_data=day_data,
+            day_num=day_num,
+            mode_default='family',
+            on_progress=cli_progress,
+            on_mini_article=lambda: progress.advance(task)
+        )
 
     return {
         'main_story': result['main_story'],
@@ -184,6 +277,8 @@ def fetch_local_story(content_gen, date_str: str) -> dict | None:
     Returns:
         Dict with 'title', 'content', 'source_url' or None if no articles
     """
+    from readwise_fetcher import ReadwiseFetcher
+
     try:
         fetcher = ReadwiseFetcher(tag="sf-good")
     except ValueError as e:
@@ -209,9 +304,17 @@ def fetch_local_story(content_gen, date_str: str) -> dict | None:
     return local_story
 
 
+@functools.lru_cache(maxsize=1)
+def get_sports_schedule():
+    """Get the shared schedule so ICS files are parsed once per run."""
+    from sports_schedule import DukeBasketballSchedule
+
+    return DukeBasketballSchedule()
+
+
 def check_for_sports_games(date_info: dict) -> dict | None:
     """Check for Duke basketball games and return feature box if found."""
-    sports_schedule = DukeBasketballSchedule()
+    sports_schedule = get_sports_schedule()
     games = []
 
     if date_info['day_name'] == 'Thursday':
@@ -243,7 +346,13 @@ def generate_day_newspaper(
     ftn_number: str = None
 ) -> None:
     """Generate newspaper for a single day."""
-    click.echo(f"\n📅 Generating {date_info['day_name']}, {date_info['formatted_date']} ({get_theme_name(day_num)})...")
+    theme = get_theme_name(day_num)
+    day_name = date_info['day_name']
+    formatted_date = date_info['formatted_date']
+    date_obj = date_info['date_obj']
+    date_str_iso = date_obj.strftime('%Y-%m-%d')
+
+    click.echo(f"\n📅 Generating {day_name}, {formatted_date} ({theme})...")
 
     # Generate or load content
     if no_rewrite:
@@ -263,8 +372,9 @@ def generate_day_newspaper(
     # Family mode: personalized content (sports, local news, xkcd)
     # Friends mode: generic content only (second main story instead)
     xkcd_comic = None
+    news_mode = get_news_mode()
 
-    if is_family_mode():
+    if news_mode == 'family':
         # Check for sports games (takes priority for feature box)
         sports_feature = check_for_sports_games(date_info)
         if sports_feature:
@@ -273,7 +383,7 @@ def generate_day_newspaper(
         # Fetch local SF story (add to front page stories)
         # If no local story available, fall back to second main story
         if content_gen:
-            local_story = fetch_local_story(content_gen, date_info['date_obj'].strftime('%Y-%m-%d'))
+            local_story = fetch_local_story(content_gen, date_str_iso)
             if local_story:
                 front_page_stories = [local_story] + list(front_page_stories or [])
             elif not no_rewrite and 'second_story' in day_data:
@@ -282,34 +392,35 @@ def generate_day_newspaper(
                 second_main_story = content_gen.generate_second_main_story(
                     original_content=second_story_data['content'],
                     source_url=second_story_data['source_url'],
-                    theme=get_theme_name(day_num),
+                    theme=theme,
                     original_title=second_story_data.get('title', '')
                 )
                 second_main_story['source_url'] = second_story_data['source_url']
 
         # Load xkcd comic if selected for this day
+        from xkcd import XkcdManager
+
         xkcd_manager = XkcdManager()
-        selected_num = xkcd_manager.get_selected_for_day(day_num, date_info['date_obj'])
+        selected_num = xkcd_manager.get_selected_for_day(day_num, date_obj)
         if selected_num:
             cache = xkcd_manager.load_cache()
             if str(selected_num) in cache:
                 xkcd_comic = cache[str(selected_num)]
 
     # Friends mode: generate second main story instead of personalized content
-    if not no_rewrite and is_friends_mode() and content_gen and 'second_story' in day_data:
+    if not no_rewrite and news_mode == 'friends' and content_gen and 'second_story' in day_data:
         click.echo("  ✍️  Generating second main story...")
         second_story_data = day_data['second_story']
         second_main_story = content_gen.generate_second_main_story(
             original_content=second_story_data['content'],
             source_url=second_story_data['source_url'],
-            theme=get_theme_name(day_num),
+            theme=theme,
             original_title=second_story_data.get('title', '')
         )
         second_main_story['source_url'] = second_story_data['source_url']
 
     # Generate PDF
     click.echo("  📄 Generating PDF...")
-    date_str_iso = date_info['date_obj'].strftime('%Y-%m-%d')
 
     # Build filename: news_fixed_NNN_YYYY-MM-DD.pdf
     if ftn_number:
@@ -326,8 +437,8 @@ def generate_day_newspaper(
         mini_articles=mini_articles,
         statistics=statistics,
         output_path=str(output_path),
-        date_str=date_info['formatted_date'],
-        day_of_week=date_info['day_name'],
+        date_str=formatted_date,
+        day_of_week=day_name,
         feature_box=feature_box,
         tomorrow_teaser=tomorrow_teaser,
         xkcd_comic=xkcd_comic,
@@ -388,14 +499,8 @@ def main(input_file, day, generate_all, combined, output, date_str, test, no_rew
         click.echo("📚 Generating combined 4-day edition...")
         days_data = []
 
-        for day_num in range(1, 5):
-            day_key = f"day_{day_num}"
-            if day_key not in ftn_data:
-                click.echo(f"⚠️  No data found for {day_key}, skipping...")
-                continue
-
+        for day_num, day_data in iter_days(ftn_data, range(1, 5)):
             date_info = week_dates[day_num]
-            day_data = ftn_data[day_key]
 
             click.echo(f"\n📅 Processing {date_info['day_name']}...")
 
@@ -453,36 +558,75 @@ def main(input_file, day, generate_all, combined, output, date_str, test, no_rew
         click.echo("\n✨ Done!")
         return
 
-    for day_num in days_to_generate:
-        day_key = f"day_{day_num}"
-        if day_key not in ftn_data:
-            click.echo(f"⚠️  No data found for {day_key} in input file, skipping...")
-            continue
+    day_tasks = [
+        {
+            'day_num': day_num,
+            'day_data': day_data,
+            'date_info': week_dates[day_num],
+            'output': output,
+            'no_rewrite': no_rewrite,
+            'ftn_number': ftn_number,
+        }
+        for day_num, day_data in iter_days(ftn_data, days_to_generate)
+    ]
 
-        try:
-            output_path = generate_day_newspaper(
-                day_num=day_num,
-                day_data=ftn_data[day_key],
-                date_info=week_dates[day_num],
-                pdf_gen=pdf_gen,
-                content_gen=content_gen,
-                output=output,
-                no_rewrite=no_rewrite,
-                ftn_number=ftn_number
-            )
-            if not no_preview:
-                preview_and_print(output_path)
-        except Exception as e:
-            click.echo(f"  ❌ Error generating Day {day_num}: {e}")
-            traceback.print_exc()
-            continue
+    if no_rewrite and len(day_tasks) > 1:
+        # Without AI calls each day is an independent, CPU-bound PDF render,
+        # so render them in parallel and preview afterwards in day order
+        max_workers = min(len(day_tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_pdf_worker,
+            initargs=(pdf_gen.templates_dir,),
+        ) as pool:
+            futures = [pool.submit(_generate_day_in_worker, task) for task in day_tasks]
+            for task, future in zip(day_tasks, futures):
+                try:
+                    output_path = future.result()
+                except Exception as e:
+                    click.echo(f"  ❌ Error generating Day {task['day_num']}: {e}")
+                    traceback.print_exception(e)
+                    continue
+                if not no_preview:
+                    preview_and_print(output_path)
+    else:
+        for task in day_tasks:
+            try:
+                output_path = generate_day_newspaper(
+                    pdf_gen=pdf_gen, content_gen=content_gen, **task
+                )
+                if not no_preview:
+                    preview_and_print(output_path)
+            except Exception as e:
+                click.echo(f"  ❌ Error generating Day {task['day_num']}: {e}")
+                traceback.print_exc()
+                continue
 
     click.echo("\n✨ Done!")
 
 
+# Each worker process's NewspaperGenerator, set up once by _init_pdf_worker
+_worker_pdf_gen = None
+
+
+def _init_pdf_worker(templates_dir: Path) -> None:
+    """Build one NewspaperGenerator per worker, using main()'s templates dir."""
+    from pdf_generator import NewspaperGenerator
+
+    global _worker_pdf_gen
+    _worker_pdf_gen = NewspaperGenerator(templates_dir)
+
+
+def _generate_day_in_worker(task: dict) -> Path:
+    """Generate one day's PDF in a worker process (parallel --no-rewrite runs)."""
+    return generate_day_newspaper(pdf_gen=_worker_pdf_gen, content_gen=None, **task)
+
+
 def generate_test_newspaper(output_dir, no_preview=False):
     """Generate a test newspaper with sample data (no API calls)."""
 
+    from pdf_generator import NewspaperGenerator
+
     click.echo("🧪 Generating test newspaper with sample data...\n")
 
     pdf_gen = NewspaperGenerator()
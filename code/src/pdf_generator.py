@@ -117,7 +117,9 @@ class NewspaperGenerator:
         ext = ".png" if image_url.endswith(".png") else ".jpg"
         image_path = cache_dir / f"xkcd_{xkcd_comic['num']}{ext}"
 
-        manager.download_comic_image(xkcd_comic["num"], image_path)
+        # Downloads are quantized once on arrival, so reuse a cached image
+        if not image_path.exists():
+            manager.download_comic_image(xkcd_comic["num"], image_path)
 
         return {
             "num": xkcd_comic.get("num"),
@@ -200,7 +202,8 @@ class NewspaperGenerator:
 
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        html.write_pdf(output_file, stylesheets=[css])
+        # Render to memory, then write the file in one call
+        output_file.write_bytes(html.write_pdf(stylesheets=[css]))
 
         return output_file
 
@@ -356,7 +359,8 @@ class NewspaperGenerator:
 
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        html.write_pdf(output_file, stylesheets=[css])
+        # Render to memory, then write the file in one call
+        output_file.write_bytes(html.write_pdf(stylesheets=[css]))
 
         # Verify page count (should be 8 for 4 days)
         expected_pages = len(days_data) * 2
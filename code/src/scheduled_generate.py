@@ -23,6 +23,7 @@ import sys
 import json
 import logging
 import tempfile
+import traceback
 import httpx
 from pathlib import Path
 from datetime import datetime
@@ -159,7 +160,6 @@ def parse_ftn_content(ftn_data: dict) -> dict | None:
 
     except Exception as e:
         logger.error(f"Failed to parse FTN content: {e}")
-        import traceback
         traceback.print_exc()
         return None
     finally:
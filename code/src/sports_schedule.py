@@ -28,6 +28,8 @@ class DukeBasketballSchedule:
 
         self.data_dir = data_dir
         self.sports_dir = data_dir / "sports"
+        # Parsed schedules indexed by date, keyed by ICS file path
+        self._schedule_index: Dict[Path, Dict] = {}
 
     def _convert_to_pacific_time(self, dtstart) -> datetime:
         """Convert datetime to Pacific timezone."""
@@ -131,14 +133,16 @@ class DukeBasketballSchedule:
         target_date: datetime.date
     ) -> List[Dict]:
         """Get games from a specific schedule file for a given date."""
-        games = []
-        if schedule_file.exists():
-            events = self.parse_ics_file(schedule_file)
-            for event in events:
-                if event['date'] == target_date:
+        index = self._schedule_index.get(schedule_file)
+        if index is None:
+            # Parse each ICS file once, then answer date lookups from the index
+            index = {}
+            if schedule_file.exists():
+                for event in self.parse_ics_file(schedule_file):
                     event['team'] = team_name
-                    games.append(event)
-        return games
+                    index.setdefault(event['date'], []).append(event)
+            self._schedule_index[schedule_file] = index
+        return [dict(event) for event in index.get(target_date, [])]
 
     def get_games_for_date(self, date: datetime.date, team: str = 'both') -> List[Dict]:
         """
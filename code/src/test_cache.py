@@ -4,6 +4,7 @@
 
 """Tests for PDF caching layer."""
 
+import os
 import tempfile
 from pathlib import Path
 from datetime import datetime
@@ -11,12 +12,18 @@ from unittest.mock import patch
 
 import pytest
 
+import cache as cache_module
 from cache import PDFCache, get_current_week, get_week_for_date
 
 
 class TestGetCurrentWeek:
     """Tests for get_current_week function."""
 
+    @pytest.fixture(autouse=True)
+    def reset_week_cache(self, monkeypatch):
+        """Each test patches the date, so start from an empty week cache."""
+        monkeypatch.setattr(cache_module, '_week_cache', (float('-inf'), ''))
+
     def test_returns_iso_week_format(self):
         """Current week should be in YYYY-WWW format."""
         week = get_current_week()
@@ -71,6 +78,14 @@ class TestGetCurrentWeek:
             assert get_current_week() == "2026-W07"
 
 
+    def test_result_cached_within_ttl(self):
+        """A second call within the TTL should not recompute the week."""
+        with patch('cache.get_target_week_monday', return_value=datetime(2026, 2, 9)) as mock_monday:
+            assert get_current_week() == "2026-W07"
+            assert get_current_week() == "2026-W07"
+        assert mock_monday.call_count == 1
+
+
 class TestGetWeekForDate:
     """Tests for get_week_for_date function."""
 
@@ -98,6 +113,31 @@ class TestPDFCache:
             cache = PDFCache(tmpdir)
             assert cache.is_cached("2026-W01") is False
 
+    def test_get_cached_pdf_returns_none_when_week_path_is_a_file(self):
+        """A non-directory where the week dir should be means not cached."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+            (Path(tmpdir) / "2026-W01").write_text("not a directory")
+            assert cache.get_cached_pdf("2026-W01") is None
+
+    def test_get_metadata_and_probe_return_none_when_week_path_is_a_file(self):
+        """Metadata lookups treat a non-directory week path as not cached."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+            (Path(tmpdir) / "2026-W01").write_text("not a directory")
+            assert cache.get_metadata("2026-W01") is None
+            assert cache.probe("2026-W01") is None
+
+    def test_probe_without_metadata(self):
+        """probe should still return the PDF when metadata.json is missing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+            fake_pdf = Path(tmpdir) / "source.pdf"
+            fake_pdf.write_text("fake pdf content")
+            cached_path = cache.cache_pdf(fake_pdf, "2026-W03")
+            (cached_path.parent / "metadata.json").unlink()
+            assert cache.probe("2026-W03") == (cached_path, None)
+
     def test_cache_and_retrieve_pdf(self):
         """Should be able to cache and retrieve a PDF."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -116,6 +156,45 @@ class TestPDFCache:
             assert cache.is_cached(week) is True
             assert cache.get_cached_pdf(week) == cached_path
 
+    def test_cache_pdf_preserves_content_and_mtime(self):
+        """Cached copy should match the source bytes, mode and mtime."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+
+            fake_pdf = Path(tmpdir) / "source.pdf"
+            fake_pdf.write_bytes(b"%PDF-1.7\n" + bytes(range(256)) * 1024)
+            os.chmod(fake_pdf, 0o640)
+            os.utime(fake_pdf, (1_700_000_000, 1_700_000_000))
+
+            cached_path = cache.cache_pdf(fake_pdf, "2026-W03")
+
+            assert cached_path.read_bytes() == fake_pdf.read_bytes()
+            assert cached_path.stat().st_mtime == fake_pdf.stat().st_mtime
+            assert cached_path.stat().st_mode & 0o777 == 0o640
+
+    def test_cache_pdf_drops_copy_from_page_cache(self, monkeypatch):
+        """The cached copy should be written back and advised DONTNEED."""
+        if not hasattr(os, 'posix_fadvise'):
+            pytest.skip("posix_fadvise not available on this platform")
+        calls = []
+        monkeypatch.setattr(os, 'posix_fadvise', lambda fd, offset, length, advice: calls.append(advice))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+            fake_pdf = Path(tmpdir) / "source.pdf"
+            fake_pdf.write_text("fake pdf content")
+            cache.cache_pdf(fake_pdf, "2026-W03")
+        assert calls == [os.POSIX_FADV_DONTNEED]
+
+    def test_cache_pdf_without_posix_fadvise(self, monkeypatch):
+        """Platforms without posix_fadvise should still get a working copy."""
+        monkeypatch.delattr(os, 'posix_fadvise', raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+            fake_pdf = Path(tmpdir) / "source.pdf"
+            fake_pdf.write_text("fake pdf content")
+            cached_path = cache.cache_pdf(fake_pdf, "2026-W03")
+            assert cached_path.read_text() == "fake pdf content"
+
     def test_metadata_stored_on_cache(self):
         """Caching should store metadata."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -163,3 +242,35 @@ class TestPDFCache:
             # List should be reverse sorted
             weeks = cache.list_cached_weeks()
             assert weeks == ["2026-W03", "2026-W02", "2026-W01"]
+
+    def test_list_cached_weeks_follows_symlinked_week_dirs(self):
+        """A week directory that is a symlink should still be listed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(Path(tmpdir) / "cache")
+
+            real_week = Path(tmpdir) / "elsewhere"
+            real_week.mkdir()
+            (real_week / "combined.pdf").write_text("fake pdf content")
+            (cache.cache_dir / "2026-W05").symlink_to(real_week, target_is_directory=True)
+
+            assert cache.list_cached_weeks() == ["2026-W05"]
+
+    def test_probe_returns_pdf_and_metadata(self):
+        """probe should return the cached PDF path with its metadata."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+
+            fake_pdf = Path(tmpdir) / "source.pdf"
+            fake_pdf.write_text("fake pdf content")
+            cached_path = cache.cache_pdf(fake_pdf, "2026-W03")
+
+            pdf_path, metadata = cache.probe("2026-W03")
+            assert pdf_path == cached_path
+            assert metadata['week'] == "2026-W03"
+
+    def test_probe_returns_none_when_not_cached(self):
+        """probe should return None for a week without a PDF."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PDFCache(tmpdir)
+            assert cache.probe("2026-W01") is None
+            assert cache.get_metadata("2026-W01") is None
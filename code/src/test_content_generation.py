@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2025 Luis Villa <luis@lu.is>
+#
+# SPDX-License-Identifier: BlueOak-1.0.0
+
+"""Tests for shared day content generation."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from content_generation import generate_day_content
+
+
+def _make_content_gen():
+    """Create a mock ContentGenerator whose mini rewrites finish out of order."""
+    content_gen = MagicMock()
+    content_gen.generate_main_story.side_effect = lambda **kw: {
+        "title": "Rewritten Main", "content": "Main body"
+    }
+
+    def fake_mini(original_content, source_url, original_title):
+        # Earlier articles take longer, so completion order is reversed
+        time.sleep(0.01 * (5 - int(original_title[-1])))
+        return {"title": f"Rewritten {original_title}", "content": original_content}
+
+    content_gen.generate_mini_article.side_effect = fake_mini
+    content_gen.generate_statistics.return_value = []
+    content_gen.generate_teaser.return_value = "Tomorrow: more"
+    return content_gen
+
+
+def _day_data(mini_count=4):
+    return {
+        "main_story": {"title": "Main", "content": "Main text", "source_url": "https://main.example"},
+        "mini_articles": [
+            {"title": f"Mini {i}", "content": f"Text {i}", "source_url": f"https://mini{i}.example"}
+            for i in range(1, mini_count + 1)
+        ],
+    }
+
+
+class TestGenerateDayContent:
+    def test_mini_articles_keep_input_order(self):
+        result = generate_day_content(_make_content_gen(), _day_data(), day_num=1)
+
+        titles = [m["title"] for m in result["mini_articles"]]
+        assert titles == ["Rewritten Mini 1", "Rewritten Mini 2", "Rewritten Mini 3", "Rewritten Mini 4"]
+
+    def test_source_urls_restored(self):
+        result = generate_day_content(_make_content_gen(), _day_data(), day_num=1)
+
+        assert result["main_story"]["source_url"] == "https://main.example"
+        assert [m["source_url"] for m in result["mini_articles"]] == [
+            f"https://mini{i}.example" for i in range(1, 5)
+        ]
+
+    def test_mini_articles_generated_concurrently(self):
+        content_gen = _make_content_gen()
+        barrier = threading.Barrier(4, timeout=5)
+
+        def blocking_mini(original_content, source_url, original_title):
+            # Only passes if all four rewrites are in flight at once
+            barrier.wait()
+            return {"title": original_title, "content": original_content}
+
+        content_gen.generate_mini_article.side_effect = blocking_mini
+        result = generate_day_content(content_gen, _day_data(), day_num=1)
+
+        assert len(result["mini_articles"]) == 4
+
+    def test_no_mini_articles(self):
+        result = generate_day_content(_make_content_gen(), _day_data(mini_count=0), day_num=4)
+
+        assert result["mini_articles"] == []
+        assert result["main_story"]["title"] == "Rewritten Main"
+        assert result["tomorrow_teaser"] == ""
+
+    def test_on_mini_article_called_per_article(self):
+        calls = []
+        generate_day_content(
+            _make_content_gen(), _day_data(), day_num=1,
+            on_mini_article=lambda: calls.append(1)
+        )
+
+        assert len(calls) == 4
+
+    def test_teaser_and_second_story_overlap_main_story(self, monkeypatch):
+        monkeypatch.setenv("NEWS_MODE", "friends")
+        content_gen = _make_content_gen()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def blocking(result):
+            def call(**kw):
+                # Only passes if main, second story and teaser are in flight at once
+                barrier.wait()
+                return result() if callable(result) else result
+            return call
+
+        content_gen.generate_main_story.side_effect = blocking(
+            lambda: {"title": "Rewritten Main", "content": "Main body"})
+        content_gen.generate_second_main_story.side_effect = blocking(
+            lambda: {"title": "Second", "content": "Second body"})
+        content_gen.generate_teaser.side_effect = blocking("Tomorrow: more")
+
+        day_data = _day_data(mini_count=0)
+        day_data["second_story"] = {
+            "title": "Two", "content": "Second text", "source_url": "https://second.example"
+        }
+        result = generate_day_content(content_gen, day_data, day_num=1)
+
+        assert result["tomorrow_teaser"] == "Tomorrow: more"
+        assert result["second_main_story"]["source_url"] == "https://second.example"
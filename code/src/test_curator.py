@@ -156,6 +156,20 @@ class TestTotalStories:
         assert curator._total_stories(day) == 1
 
 
+class TestDayFill:
+    def test_count_and_capacity_without_second(self, curator):
+        # 1 main + 3 minis, 5 slots
+        assert curator._day_fill(curator.working_data["day_1"]) == (4, 5)
+
+    def test_second_story_raises_capacity(self, curator):
+        day = curator.working_data["day_1"]
+        day["second_story"] = _make_story("Second")
+        assert curator._day_fill(day) == (5, 6)
+
+    def test_missing_main_not_counted(self, curator):
+        assert curator._day_fill({"mini_articles": [_make_story("Mini")]}) == (1, 5)
+
+
 # ── _get_story_by_index tests ───────────────────────────────────
 
 
@@ -227,6 +241,14 @@ class TestSwapMainStory:
         assert len(curator.changes_made) == 1
         assert "Swapped main story" in curator.changes_made[0]
 
+    def test_swap_appends_to_change_log(self, curator):
+        curator.swap_main_story(1, 2)
+        curator.swap_main_story(1, 2)
+        log_path = curator.output_file.with_suffix(".changes.log")
+        entries = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert len(entries) == 2
+        assert entries[0]["change"] == "Day 1: Swapped main story"
+
     def test_swap_auto_saves(self, curator):
         curator.swap_main_story(1, 2)
         # Output file should exist with saved data
@@ -284,6 +306,76 @@ class TestMoveStory:
         result = curator.move_story(1, 2, 5)  # Day 5 doesn't exist
         assert result is False
 
+    def _fill_day_2(self, curator):
+        # Day 2: 1 main + 4 minis = full
+        curator.working_data["day_2"]["mini_articles"] += [_make_story("Env Mini 3"), _make_story("Env Mini 4")]
+
+    def test_overflow_swap_puts_swapped_story_in_same_mini_slot(self, curator):
+        self._fill_day_2(curator)
+        day2_mini = curator.working_data["day_2"]["mini_articles"][0]
+
+        def swap_first(to_day, incoming):
+            curator.working_data["day_2"]["mini_articles"][0] = incoming
+            return 'swap', day2_mini
+
+        curator._handle_overflow = swap_first
+        curator.move_story(1, 3, 2)  # Health Mini 2
+        titles = [m["title"] for m in curator.working_data["day_1"]["mini_articles"]]
+        assert titles == ["Health Mini 1", "Env Mini 1", "Health Mini 3"]
+        assert curator.working_data["day_2"]["mini_articles"][0]["title"] == "Health Mini 2"
+
+    def test_overflow_swap_of_main_keeps_second_story(self, curator):
+        self._fill_day_2(curator)
+        curator.working_data["day_1"]["second_story"] = _make_story("Second")
+        day2_mini = curator.working_data["day_2"]["mini_articles"][0]
+
+        def swap_first(to_day, incoming):
+            curator.working_data["day_2"]["mini_articles"][0] = incoming
+            return 'swap', day2_mini
+
+        curator._handle_overflow = swap_first
+        curator.move_story(1, 1, 2)
+        day1 = curator.working_data["day_1"]
+        assert day1["main_story"]["title"] == "Env Mini 1"
+        assert day1["second_story"]["title"] == "Second"
+        assert len(day1["mini_articles"]) == 3
+
+    def test_overflow_replace_moves_story_and_drops_target(self, curator):
+        self._fill_day_2(curator)
+
+        def replace_first(to_day, incoming):
+            curator.working_data["day_2"]["mini_articles"][0] = incoming
+            return 'replace', None
+
+        curator._handle_overflow = replace_first
+        curator.move_story(1, 3, 2)  # Health Mini 2
+        day1_titles = [m["title"] for m in curator.working_data["day_1"]["mini_articles"]]
+        day2_titles = [m["title"] for m in curator.working_data["day_2"]["mini_articles"]]
+        assert day1_titles == ["Health Mini 1", "Health Mini 3"]
+        assert day2_titles[0] == "Health Mini 2"
+        assert "Env Mini 1" not in day2_titles
+        assert len(day2_titles) == 4
+
+    def test_overflow_replace_of_equal_copy_still_removes_source(self, curator):
+        """Replace is reported explicitly, so it doesn't rely on object identity."""
+        self._fill_day_2(curator)
+
+        def replace_with_copy(to_day, incoming):
+            curator.working_data["day_2"]["mini_articles"][0] = dict(incoming)
+            return 'replace', None
+
+        curator._handle_overflow = replace_with_copy
+        curator.move_story(1, 3, 2)
+        titles = [m["title"] for m in curator.working_data["day_1"]["mini_articles"]]
+        assert titles == ["Health Mini 1", "Health Mini 3"]
+
+    def test_overflow_cancel_leaves_story_in_place(self, curator):
+        self._fill_day_2(curator)
+        curator.move_story(1, 2, 2)  # default handler cancels
+        titles = [m["title"] for m in curator.working_data["day_1"]["mini_articles"]]
+        assert titles == ["Health Mini 1", "Health Mini 2", "Health Mini 3"]
+        assert len(curator.working_data["day_2"]["mini_articles"]) == 4
+
     def test_move_auto_saves(self, curator):
         curator.move_story(1, 2, 2)
         saved = json.loads(curator.output_file.read_text())
@@ -389,6 +481,14 @@ class TestValidateData:
         # for missing main story. So it should still be True overall.
         assert result is True
 
+    def test_reports_all_missing_main_stories(self, curator):
+        curator.working_data["day_1"]["main_story"] = {}
+        curator.working_data["day_3"]["main_story"] = {"content": "stuff"}
+        assert curator.validate_data() is False
+        printed = " ".join(str(c.args[0]) for c in curator.console.print.call_args_list)
+        assert "Day 1 has no main story" in printed
+        assert "Day 3 has no main story" in printed
+
     def test_too_many_minis_still_valid(self, curator):
         """More than 4 minis produces a warning but data is still valid."""
         day = curator.working_data["day_3"]
@@ -422,6 +522,71 @@ class TestAutoSave:
         saved = json.loads(curator.output_file.read_text())
         assert "theme_metadata" in saved
 
+    def test_auto_save_handles_int_theme_keys(self, curator):
+        curator.working_data["theme_metadata"] = {1: {"name": "Custom Theme"}}
+        curator._auto_save()
+        saved = json.loads(curator.output_file.read_text())
+        assert saved["theme_metadata"]["1"]["name"] == "Custom Theme"
+
+    def test_auto_save_skips_unchanged_data(self, curator, monkeypatch):
+        import curator_data
+
+        writes = []
+        real_write = curator_data._write_bytes_atomic
+        monkeypatch.setattr(curator_data, "_write_bytes_atomic",
+                            lambda path, buf: (writes.append(path), real_write(path, buf)))
+        curator._auto_save()
+        curator._auto_save()
+        assert len(writes) == 1
+
+        curator.working_data["day_1"]["theme"] = "Changed"
+        curator._auto_save()
+        assert len(writes) == 2
+
+
+# ── save_curated tests ──────────────────────────────────────────
+
+
+class TestSaveCurated:
+    def test_save_excludes_unused(self, curator, tmp_path):
+        out = tmp_path / "curated.json"
+        curator.save_curated(out, generate_teasers=False)
+        saved = json.loads(out.read_text(encoding="utf-8"))
+        assert "day_1" in saved
+        assert "unused" not in saved
+
+    def test_save_accepts_int_theme_keys(self, curator, tmp_path):
+        curator.revert_to_default_themes()  # theme_metadata keyed by int day
+        out = tmp_path / "curated.json"
+        curator.save_curated(out, generate_teasers=False)
+        saved = json.loads(out.read_text(encoding="utf-8"))
+        assert saved["theme_metadata"]["1"]["source"] == "default"
+
+    def test_save_keeps_non_ascii_readable(self, curator, tmp_path):
+        curator.working_data["day_1"]["main_story"]["title"] = "Café — naïve"
+        out = tmp_path / "curated.json"
+        curator.save_curated(out, generate_teasers=False)
+        text = out.read_text(encoding="utf-8")
+        assert "Café — naïve" in text
+        assert text.endswith("\n")
+
+    def test_save_is_compact_by_default(self, curator, tmp_path):
+        out = tmp_path / "curated.json"
+        curator.save_curated(out, generate_teasers=False)
+        assert out.read_text(encoding="utf-8").count("\n") == 1
+
+    def test_save_pretty_indents(self, curator, tmp_path):
+        out = tmp_path / "curated.json"
+        curator.save_curated(out, generate_teasers=False, pretty=True)
+        assert '\n  "day_1": {' in out.read_text(encoding="utf-8")
+
+    def test_save_replaces_file_without_leaving_temp(self, curator, tmp_path):
+        out = tmp_path / "curated.json"
+        out.write_text("stale")
+        curator.save_curated(out, generate_teasers=False)
+        assert "day_1" in json.loads(out.read_text(encoding="utf-8"))
+        assert list(tmp_path.glob("*.tmp")) == []
+
 
 # ── revert_to_default_themes tests ──────────────────────────────
 
@@ -462,7 +627,17 @@ class TestStoryCuratorInit:
         cur = StoryCuratorData(json_file, console=MagicMock())
         # Modifying working_data should not affect original
         cur.working_data["day_1"]["main_story"]["title"] = "CHANGED"
-        assert cur.original_data["day_1"]["main_story"]["title"] == "Health Main"
+        assert cur.load_original()["day_1"]["main_story"]["title"] == "Health Main"
+
+    def test_warns_once_for_missing_days(self, tmp_path):
+        data = _sample_data()
+        del data["day_2"], data["day_4"]
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(data))
+        console = MagicMock()
+        StoryCuratorData(json_file, console=console)
+        console.print.assert_called_once()
+        assert "day_2, day_4 not found" in console.print.call_args[0][0]
 
     def test_raises_on_missing_file(self, tmp_path):
         with pytest.raises(FileNotFoundError):
@@ -515,3 +690,218 @@ class TestChainedOperations:
         # Should be back as a mini in day 1
         titles = [m["title"] for m in curator.working_data["day_1"]["mini_articles"]]
         assert original_title in titles
+
+
+# ── Overview display tests ──────────────────────────────────────
+
+
+class TestDisplayOverview:
+    def test_plain_output_when_not_a_terminal(self, tmp_path, capsys):
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(_sample_data()))
+        cur = StoryCurator(json_file)
+        cur.display_overview()
+        out = capsys.readouterr().out
+        assert "Day 1: Health & Education" in out
+        assert "1\tMAIN\tHealth Main\t" in out
+        assert "2\tmini\tHealth Mini 1\t" in out
+        assert "1\tUnused A\t" in out
+
+    def test_overview_caps_unused_rows(self, tmp_path):
+        data = _sample_data()
+        data["unused"]["stories"] = [_make_story(f"Unused {i}") for i in range(25)]
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(data))
+        table, total, _ = StoryCurator(json_file)._build_unused_table(page_size=0, max_rows=20)
+        assert total == 25
+        assert table.row_count == 21  # 20 stories + "more" footer
+        assert "5 more" in table.columns[1]._cells[-1]
+
+    def test_story_panel_shows_brackets_literally(self):
+        from curator import _story_panel
+        from rich.console import Console
+
+        console = Console(width=80, record=True)
+        story = _make_story("Odd [/bold] title", content="x" * 600)
+        console.print(_story_panel(story, "Role", "MAIN story", "Day 1 - Story 1"))
+        text = console.export_text()
+        assert "Odd [/bold] title" in text
+        assert "600 characters" in text
+        assert "x" * 40 + "..." in text.replace("\n", "").replace("│", "").replace(" ", "")
+
+
+# ── Menu input parsing tests ────────────────────────────────────
+
+
+class TestParseIntInRange:
+    def test_in_range(self):
+        assert StoryCurator._parse_int_in_range("3", 1, 4) == 3
+        assert StoryCurator._parse_int_in_range("1", 1, 4) == 1
+        assert StoryCurator._parse_int_in_range("4", 1, 4) == 4
+
+    def test_out_of_range(self):
+        assert StoryCurator._parse_int_in_range("0", 1, 4) is None
+        assert StoryCurator._parse_int_in_range("5", 1, 4) is None
+
+    def test_not_a_number(self):
+        for s in ("", "x", "-1", "2.5", "²"):
+            assert StoryCurator._parse_int_in_range(s, 1, 4) is None
+
+
+class TestThemeDays:
+    def test_mixed_key_types_sorted_by_day(self):
+        from curator import _theme_days
+
+        meta = {"3": {"name": "C"}, 1: {"name": "A"}, "2": {"name": "B"}}
+        assert _theme_days(meta) == [(1, {"name": "A"}), (2, {"name": "B"}), (3, {"name": "C"})]
+
+
+class TestReviewMenus:
+    @pytest.fixture
+    def tui(self, tmp_path, monkeypatch):
+        import curator as curator_module
+
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(_sample_data()))
+        monkeypatch.setattr(curator_module, "console", MagicMock())
+        return StoryCurator(json_file), curator_module.console
+
+    @pytest.mark.parametrize("key,action", [
+        ("a", "accept"), ("M", "move"), ("s", "swap"), ("c", "combine"), ("v", "view"), ("b", "back"),
+    ])
+    def test_review_day_actions(self, tui, key, action):
+        cur, console = tui
+        console.input.return_value = key
+        assert cur.review_day(1) == action
+
+    def test_review_day_unknown_key_accepts(self, tui):
+        cur, console = tui
+        console.input.return_value = "z"
+        assert cur.review_day(1) == "accept"
+
+    def test_review_themes_reprompts_until_valid(self, tui):
+        cur, console = tui
+        cur.working_data["theme_metadata"] = {"1": {"name": "Health", "source": "default"}}
+        console.input.side_effect = ["x", "e"]
+        assert cur.review_themes() == "edit"
+        assert console.input.call_count == 2
+
+    @pytest.mark.parametrize("keys,outcome", [
+        (["c"], "cancel"), (["x"], "cancel"), (["s", "back"], "cancel"),
+        (["s", "1"], "swap"), (["r", "1"], "replace"),
+    ])
+    def test_handle_overflow_outcomes(self, tui, keys, outcome):
+        cur, console = tui
+        console.input.side_effect = keys
+        incoming = _make_story("Incoming")
+        result, swapped = cur._handle_overflow(2, incoming)
+        assert result == outcome
+        assert (swapped is not None) == (outcome == "swap")
+        day2_first = cur.working_data["day_2"]["mini_articles"][0]
+        assert (day2_first is incoming) == (outcome != "cancel")
+
+
+class TestFetchMoreComics:
+    def test_skips_rejected_and_analyzed_with_one_cache_load(self, tmp_path, monkeypatch):
+        import curator as curator_module
+
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(_sample_data()))
+        monkeypatch.setattr(curator_module, "console", MagicMock())
+        cur = StoryCurator(json_file)
+
+        manager = MagicMock()
+        manager.fetch_recent_comics.return_value = [{"num": n, "title": str(n)} for n in (1, 2, 3)]
+        manager.fetch_random_comics.return_value = [{"num": 4, "title": "4"}, {"num": 3, "title": "3"}]
+        manager.load_rejected.return_value = {"1": {"reason": "too_dark"}}
+        manager.load_cache.return_value = {"2": {"analysis": {}}, "3": {"num": 3}}
+
+        cur._fetch_more_comics(manager)
+
+        analyzed = [c.args[0]["num"] for c in manager.analyze_comic.call_args_list]
+        assert analyzed == [3, 4]
+        assert manager.load_cache.call_count == 1
+
+    def test_failed_analysis_is_retried(self, tmp_path, monkeypatch):
+        import curator as curator_module
+
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(_sample_data()))
+        monkeypatch.setattr(curator_module, "console", MagicMock())
+        cur = StoryCurator(json_file)
+
+        manager = MagicMock()
+        manager.fetch_recent_comics.return_value = [{"num": 5, "title": "5"}]
+        manager.fetch_random_comics.return_value = [{"num": 5, "title": "5"}]
+        manager.load_rejected.return_value = {}
+        manager.load_cache.return_value = {}
+        manager.analyze_comic.side_effect = [RuntimeError("timeout"), {}]
+
+        cur._fetch_more_comics(manager)
+
+        assert manager.analyze_comic.call_count == 2
+
+
+class TestReviewXkcd:
+    @pytest.fixture
+    def tui(self, tmp_path, monkeypatch):
+        import curator as curator_module
+
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(_sample_data()))
+        monkeypatch.setattr(curator_module, "console", MagicMock())
+
+        comics = {str(n): {"num": n, "title": f"Comic {n}", "analysis": {"brief_summary": "s"}}
+                  for n in range(10, 16)}
+        manager = MagicMock()
+        manager.load_cache.return_value = comics
+        manager.get_week_selections.return_value = {}
+        manager.get_candidates.return_value = sorted(comics.values(), key=lambda c: -c["num"])
+        manager.auto_select_for_week.return_value = {1: 10, 2: 11, 3: 12, 4: 13}
+        monkeypatch.setattr(curator_module, "XkcdManager", lambda: manager)
+        return StoryCurator(json_file), curator_module.console, manager
+
+    def test_accept_saves_all_four(self, tui):
+        cur, console, manager = tui
+        console.input.side_effect = ["a"]
+        cur.review_xkcd()
+        manager.save_week_selections.assert_called_once_with({1: 10, 2: 11, 3: 12, 4: 13})
+
+    def test_veto_auto_pick_replaces_one_day(self, tui):
+        cur, console, manager = tui
+        console.input.side_effect = ["2", "a", "a"]
+        cur.review_xkcd()
+        manager.save_week_selections.assert_called_once_with({1: 10, 2: 15, 3: 12, 4: 13})
+
+    def test_veto_reprints_only_changed_day(self, tui):
+        cur, console, manager = tui
+        console.input.side_effect = ["2", "a", "a"]
+        cur.review_xkcd()
+        printed = [str(c.args[0]) for c in console.print.call_args_list if c.args]
+        assert sum("Day 1 (" in p for p in printed) == 1
+        assert sum("Day 2 (" in p for p in printed) == 2
+
+    @pytest.mark.parametrize("pick,expected", [("2", 14), ("9", 15), ("x", 15)])
+    def test_veto_manual_pick_falls_back_to_auto_pick(self, tui, pick, expected):
+        cur, console, manager = tui
+        console.input.side_effect = ["4", "m", pick, "a"]
+        cur.review_xkcd()
+        manager.save_week_selections.assert_called_once_with({1: 10, 2: 11, 3: 12, 4: expected})
+
+    @pytest.mark.parametrize("reason_key,reason", [("3", "too_dark"), ("6", "other"), ("7", None), ("x", None)])
+    def test_veto_reject_records_reason(self, tui, reason_key, reason):
+        cur, console, manager = tui
+        console.input.side_effect = ["1", "r", reason_key, "a"]
+        cur.review_xkcd()
+        if reason is None:
+            manager.reject_comic.assert_not_called()
+        else:
+            manager.reject_comic.assert_called_once_with(10, reason)
+        manager.save_week_selections.assert_called_once_with({1: 15, 2: 11, 3: 12, 4: 13})
+
+    def test_repeated_vetoes_do_not_reuse_picked_comic(self, tui):
+        cur, console, manager = tui
+        console.input.side_effect = ["1", "a", "2", "a", "1", "a", "a"]
+        cur.review_xkcd()
+        # Day 1 goes 10 -> 15 -> 11 (freed by Day 2's veto); Day 2 goes 11 -> 14
+        manager.save_week_selections.assert_called_once_with({1: 11, 2: 14, 3: 12, 4: 13})
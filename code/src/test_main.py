@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2025 Luis Villa <luis@lu.is>
+#
+# SPDX-License-Identifier: BlueOak-1.0.0
+
+"""Tests for main module."""
+
+import os
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+from click.testing import CliRunner
+
+import main
+
+
+class TestLoadFtnData:
+    """Tests for the parsed FTN data cache in load_ftn_data."""
+
+    @pytest.fixture
+    def cache_home(self, tmp_path, monkeypatch):
+        """Point the user cache at a temp dir and return the FTN cache dir."""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / "xdg"))
+        return tmp_path / "xdg" / "news-fixed" / "ftn-cache"
+
+    @pytest.fixture
+    def ftn_file(self, tmp_path):
+        path = tmp_path / "ftn-316.json"
+        path.write_bytes(orjson.dumps({"day_1": {"main_story": {"title": "One"}}}))
+        return path
+
+    def test_second_load_is_a_cache_hit(self, cache_home, ftn_file):
+        """An unchanged input should be served from the cache without parsing."""
+        first = main.load_ftn_data(str(ftn_file))
+        assert len(list(cache_home.iterdir())) == 1
+
+        with patch('main.orjson.loads', side_effect=AssertionError("re-parsed")):
+            assert main.load_ftn_data(str(ftn_file)) == first
+
+    def test_cache_dir_is_user_private(self, cache_home, ftn_file):
+        """The cache directory is created readable by the owner only."""
+        main.load_ftn_data(str(ftn_file))
+        assert cache_home.stat().st_mode & 0o777 == 0o700
+
+    def test_size_change_invalidates_and_prunes(self, cache_home, ftn_file):
+        """Editing the input should re-parse and replace the stale entry."""
+        main.load_ftn_data(str(ftn_file))
+        old_entries = set(cache_home.iterdir())
+
+        ftn_file.write_bytes(orjson.dumps({"day_1": {"main_story": {"title": "Edited"}}}))
+        data = main.load_ftn_data(str(ftn_file))
+
+        assert data["day_1"]["main_story"]["title"] == "Edited"
+        entries = set(cache_home.iterdir())
+        assert len(entries) == 1
+        assert entries.isdisjoint(old_entries)
+
+    def test_mtime_change_invalidates(self, cache_home, ftn_file):
+        """Touching the input without changing its size should still miss."""
+        main.load_ftn_data(str(ftn_file))
+        st = ftn_file.stat()
+        os.utime(ftn_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        with patch('main.orjson.loads', wraps=orjson.loads) as mock_loads:
+            main.load_ftn_data(str(ftn_file))
+        mock_loads.assert_called_once()
+        assert len(list(cache_home.iterdir())) == 1
+
+    def test_other_inputs_are_not_pruned(self, cache_home, ftn_file, tmp_path):
+        """Pruning only removes stale entries for the same input file."""
+        other = tmp_path / "ftn-317.json"
+        other.write_bytes(orjson.dumps({"day_1": {}}))
+        main.load_ftn_data(str(other))
+        main.load_ftn_data(str(ftn_file))
+        assert len(list(cache_home.iterdir())) == 2
+
+    def test_shared_writable_cache_dir_is_ignored(self, cache_home, ftn_file):
+        """A cache dir others can write to must never be unpickled from."""
+        main.load_ftn_data(str(ftn_file))
+        os.chmod(cache_home, 0o777)
+
+        with patch('main.pickle.load', side_effect=AssertionError("unpickled")):
+            data = main.load_ftn_data(str(ftn_file))
+        assert data["day_1"]["main_story"]["title"] == "One"
+
+
+class TestParallelNoRewrite:
+    """Tests for the --no-rewrite worker-process path in main()."""
+
+    @pytest.fixture
+    def fake_pdf_generator(self, monkeypatch):
+        """Stand in for pdf_generator, which needs system PDF libraries."""
+        module = types.ModuleType("pdf_generator")
+        module.NewspaperGenerator = MagicMock(name="NewspaperGenerator")
+        monkeypatch.setitem(sys.modules, "pdf_generator", module)
+        return module.NewspaperGenerator
+
+    def test_worker_reuses_one_generator_from_templates_dir(self, fake_pdf_generator, tmp_path, monkeypatch):
+        monkeypatch.setattr(main, "_worker_pdf_gen", None)
+        main._init_pdf_worker(tmp_path / "templates")
+
+        task = {"day_num": 2, "day_data": {}, "date_info": {}, "output": str(tmp_path),
+                "no_rewrite": True, "ftn_number": "316"}
+        with patch("main.generate_day_newspaper", return_value=tmp_path / "day2.pdf") as mock_gen:
+            assert main._generate_day_in_worker(task) == tmp_path / "day2.pdf"
+            main._generate_day_in_worker(task)
+
+        fake_pdf_generator.assert_called_once_with(tmp_path / "templates")
+        kwargs = mock_gen.call_args.kwargs
+        assert kwargs["pdf_gen"] is fake_pdf_generator.return_value
+        assert kwargs["content_gen"] is None
+        assert kwargs["day_num"] == 2 and kwargs["ftn_number"] == "316"
+
+    def _run_all(self, tmp_path, no_rewrite):
+        """Run main --all with rendering stubbed; return the previewed paths."""
+        ftn_file = tmp_path / "ftn-316.json"
+        ftn_file.write_bytes(orjson.dumps({f"day_{n}": {"theme": str(n)} for n in range(1, 5)}))
+
+        def fake_generate(day_num, output, **kwargs):
+            # Later days finish first, so completion order differs from day order
+            time.sleep((5 - day_num) * 0.02)
+            return Path(output) / f"day{day_num}.pdf"
+
+        previewed = []
+        args = ["--input", str(ftn_file), "--all", "-o", str(tmp_path / "out")]
+        if no_rewrite:
+            args.append("--no-rewrite")
+        with patch("main.initialize_generators", return_value=(MagicMock(templates_dir=tmp_path), MagicMock())), \
+                patch("main.generate_day_newspaper", side_effect=fake_generate), \
+                patch("main.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch("main.preview_and_print", side_effect=previewed.append):
+            result = CliRunner().invoke(main.main, args)
+        assert result.exit_code == 0, result.output
+        return previewed
+
+    def test_parallel_results_collected_in_day_order(self, fake_pdf_generator, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        parallel = self._run_all(tmp_path, no_rewrite=True)
+        assert fake_pdf_generator.called  # went through the worker path
+        serial = self._run_all(tmp_path, no_rewrite=False)
+
+        out = tmp_path / "out"
+        assert parallel == [out / f"day{n}.pdf" for n in range(1, 5)]
+        assert parallel == serial
@@ -3,6 +3,7 @@ import json
 import tempfile
 from pathlib import Path
 import pytest
+from unittest.mock import patch
 
 
 def test_load_empty_cache():
@@ -38,6 +39,37 @@ def test_save_and_load_cache():
         assert loaded == test_data
 
 
+def test_load_cache_reused_until_file_changes():
+    """Repeated loads reuse the parsed cache; an external write is picked up."""
+    from xkcd import XkcdManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = XkcdManager(data_dir=Path(tmpdir))
+        manager.save_cache({"1": {"num": 1}})
+
+        with patch("xkcd.json.load", wraps=json.load) as mock_load:
+            first = manager.load_cache()
+            assert manager.load_cache() == first
+        mock_load.assert_not_called()
+
+        manager.cache_file.write_text(json.dumps({"1": {"num": 1}, "2": {"num": 2}, "3": {"num": 3}}))
+        assert set(manager.load_cache()) == {"1", "2", "3"}
+
+
+def test_load_cache_unsaved_edits_do_not_leak():
+    """Edits to a loaded cache that are never saved don't show up in later loads."""
+    from xkcd import XkcdManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = XkcdManager(data_dir=Path(tmpdir))
+        manager.save_cache({"1": {"num": 1}})
+
+        cache = manager.load_cache()
+        cache["2"] = {"num": 2}
+
+        assert set(manager.load_cache()) == {"1"}
+
+
 def test_load_empty_rejected():
     """Loading non-existent rejected list returns empty dict."""
     from xkcd import XkcdManager
@@ -436,3 +468,92 @@ def test_download_comic_image():
         assert result_path == dest
         assert dest.exists()
         assert dest.stat().st_size > 0
+
+
+def test_quantize_png_converts_rgb_to_palette(tmp_path):
+    """Truecolor PNGs become 8-bit palette PNGs of the same size."""
+    from PIL import Image
+    from xkcd import _quantize_png
+
+    path = tmp_path / "comic.png"
+    Image.new("RGB", (120, 80), (255, 255, 255)).save(path)
+
+    _quantize_png(path)
+
+    with Image.open(path) as img:
+        assert img.mode == "P"
+        assert img.size == (120, 80)
+
+
+def test_quantize_png_flattens_rgba_onto_white(tmp_path):
+    """RGBA PNGs are quantized too, with transparency flattened onto white."""
+    from PIL import Image
+    from xkcd import _quantize_png
+
+    path = tmp_path / "comic.png"
+    img = Image.new("RGBA", (20, 10), (0, 0, 0, 0))
+    img.paste((0, 0, 0, 255), (0, 0, 10, 10))
+    img.save(path)
+
+    _quantize_png(path)
+
+    with Image.open(path) as out:
+        assert out.mode == "P"
+        assert out.size == (20, 10)
+        rgb = out.convert("RGB")
+        assert rgb.getpixel((2, 2)) == (0, 0, 0)
+        assert rgb.getpixel((15, 5)) == (255, 255, 255)
+
+
+def test_quantize_png_leaves_palette_image_untouched(tmp_path):
+    """An already-paletted PNG is not rewritten."""
+    from PIL import Image
+    from xkcd import _quantize_png
+
+    path = tmp_path / "comic.png"
+    Image.new("P", (10, 10)).save(path)
+    before = path.stat().st_mtime_ns
+
+    _quantize_png(path)
+
+    assert path.stat().st_mtime_ns == before
+
+
+def test_download_comic_image_quantizes_png(tmp_path):
+    """Downloaded PNGs are quantized once, as they arrive."""
+    import io
+    from unittest.mock import MagicMock, patch
+    from PIL import Image
+    from xkcd import XkcdManager
+
+    manager = XkcdManager(data_dir=tmp_path)
+    manager.save_cache({"1": {"num": 1, "img": "https://imgs.xkcd.com/comics/one.png"}})
+
+    buf = io.BytesIO()
+    Image.new("RGB", (40, 30), (0, 0, 0)).save(buf, format="PNG")
+    response = MagicMock(content=buf.getvalue())
+
+    dest = tmp_path / "xkcd_1.png"
+    with patch("xkcd.httpx.get", return_value=response):
+        assert manager.download_comic_image(1, dest) == dest
+
+    with Image.open(dest) as img:
+        assert img.mode == "P"
+        assert img.size == (40, 30)
+
+
+def test_download_comic_image_failure_leaves_no_file(tmp_path):
+    """A download that can't be decoded leaves neither the image nor a temp file."""
+    from unittest.mock import MagicMock, patch
+    from xkcd import XkcdManager
+
+    manager = XkcdManager(data_dir=tmp_path)
+    manager.save_cache({"1": {"num": 1, "img": "https://imgs.xkcd.com/comics/one.png"}})
+
+    dest = tmp_path / "xkcd_1.png"
+    with patch("xkcd.httpx.get", return_value=MagicMock(content=b"truncated")):
+        with pytest.raises(Exception):
+            manager.download_comic_image(1, dest)
+
+    assert not dest.exists()
+    assert not (tmp_path / "xkcd_1.png.tmp").exists()
@@ -7,6 +7,7 @@
 import qrcode
 import io
 import base64
+import functools
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
@@ -61,6 +62,7 @@ def format_date(date_str: str = None) -> str:
     return date_obj.strftime("%A, %B %d, %Y")
 
 
+@functools.lru_cache(maxsize=8)
 def get_theme_name(day_number: int) -> str:
     """
     Get the theme name for a given day number.
@@ -94,15 +96,9 @@ def get_target_week_monday(base_date: datetime = None) -> datetime:
 
     current_weekday = base_date.weekday()  # Monday=0, Sunday=6
 
-    if current_weekday >= 4:  # Friday-Sunday → next week
-        days_until_monday = (7 - current_weekday) % 7
-        if days_until_monday == 0:
-            days_until_monday = 7
-        monday = base_date + timedelta(days=days_until_monday)
-    else:  # Monday-Thursday → this week
-        monday = base_date - timedelta(days=current_weekday)
-
-    return monday
+    # Monday-Thursday → back to this week's Monday; Friday-Sunday → ahead to next
+    offset = -current_weekday if current_weekday < 4 else 7 - current_weekday
+    return base_date + timedelta(days=offset)
 
 
 def extract_source_name(url: str) -> str:
@@ -31,13 +31,13 @@ pdf_cache = PDFCache(cache_dir)
 def index():
     """Landing page."""
     week = get_current_week()
-    has_pdf = pdf_cache.is_cached(week)
-    metadata = pdf_cache.get_metadata(week)
+    cached = pdf_cache.probe(week)
+    metadata = cached[1] if cached else None
 
     return render_template(
         'landing.html',
         week=week,
-        has_pdf=has_pdf,
+        has_pdf=cached is not None,
         cached_at=metadata.get('cached_at') if metadata else None
     )
 
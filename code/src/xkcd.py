@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, Optional
 import httpx
 import base64
+from PIL import Image
 from anthropic import Anthropic
 from dotenv import load_dotenv
 import os
@@ -21,18 +22,40 @@ load_dotenv()
 from utils import get_target_week_monday
 
 
+REJECTION_REASONS = (
+    "too_complex",
+    "adult_humor",
+    "too_dark",
+    "multi_panel",
+    "requires_context",
+    "other"
+)
+
+
+def _quantize_png(image_path: Path) -> None:
+    """
+    Re-save a truecolor (RGB or RGBA) PNG as an 8-bit palette PNG, in place.
+
+    Comics are line art printed in black and white, so 256 colors is
+    visually lossless and shrinks the image embedded in the PDF.
+    Transparency is flattened onto white, the color of the printed page.
+    Images that are already paletted (mode P) or grayscale are left alone.
+    """
+    with Image.open(image_path) as img:
+        if img.mode == "RGBA":
+            flat = Image.new("RGB", img.size, (255, 255, 255))
+            flat.paste(img, mask=img.getchannel("A"))
+        elif img.mode == "RGB":
+            flat = img
+        else:
+            return
+        quantized = flat.quantize(colors=256)
+    quantized.save(image_path, format="PNG", optimize=True)
+
+
 class XkcdManager:
     """Manages xkcd comic fetching, analysis, and selection."""
 
-    REJECTION_REASONS = [
-        "too_complex",
-        "adult_humor",
-        "too_dark",
-        "multi_panel",
-        "requires_context",
-        "other"
-    ]
-
     def __init__(self, data_dir: Optional[Path] = None):
         """
         Initialize the xkcd manager.
@@ -51,17 +74,40 @@ class XkcdManager:
         self.rejected_file = self.data_dir / "xkcd_rejected.json"
         self.selected_file = self.data_dir / "xkcd_selected.json"
 
+        # Last cache dict loaded or saved, with the (mtime_ns, size) of the
+        # file it matches; reused until the file changes on disk
+        self._cache: Optional[Dict] = None
+        self._cache_stamp: Optional[tuple] = None
+
+    def _cache_file_stamp(self) -> Optional[tuple]:
+        """Get (mtime_ns, size) of the cache file, or None if it doesn't exist."""
+        try:
+            st = os.stat(self.cache_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def load_cache(self) -> Dict:
-        """Load the comic cache from disk."""
-        if not self.cache_file.exists():
+        """Load the comic cache from disk (parsed again only when the file changes).
+
+        Returns a shallow copy of the parsed cache, so a caller that edits it
+        and fails before save_cache can't leak the edit into later loads.
+        """
+        stamp = self._cache_file_stamp()
+        if stamp is None:
             return {}
-        with open(self.cache_file, 'r') as f:
-            return json.load(f)
+        if stamp != self._cache_stamp:
+            with open(self.cache_file, 'r') as f:
+                self._cache = json.load(f)
+            self._cache_stamp = stamp
+        return dict(self._cache)
 
     def save_cache(self, cache: Dict) -> None:
         """Save the comic cache to disk."""
         with open(self.cache_file, 'w') as f:
             json.dump(cache, f, indent=2)
+        self._cache = dict(cache)
+        self._cache_stamp = self._cache_file_stamp()
 
     def load_rejected(self) -> Dict:
         """Load the rejected comics list from disk."""
@@ -95,8 +141,8 @@ class XkcdManager:
             comic_num: Comic number
             reason: Rejection reason (must be in REJECTION_REASONS)
         """
-        if reason not in self.REJECTION_REASONS:
-            raise ValueError(f"Invalid reason. Must be one of: {self.REJECTION_REASONS}")
+        if reason not in REJECTION_REASONS:
+            raise ValueError(f"Invalid reason. Must be one of: {list(REJECTION_REASONS)}")
 
         rejected = self.load_rejected()
         rejected[str(comic_num)] = {
@@ -304,10 +350,8 @@ class XkcdManager:
         # Add timestamp
         analysis["analyzed_at"] = datetime.now().isoformat()
 
-        # Cache the result
-        if comic_num not in cache:
-            cache[comic_num] = comic
-        cache[comic_num]["analysis"] = analysis
+        # Cache the result (as a new entry: load_cache copies are shallow)
+        cache[comic_num] = {**cache.get(comic_num, comic), "analysis": analysis}
         self.save_cache(cache)
 
         return analysis
@@ -577,7 +621,17 @@ class XkcdManager:
         dest_path = Path(dest_path)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(dest_path, 'wb') as f:
-            f.write(response.content)
+        # Write and quantize a sibling temp file, then swap it in, so a
+        # failed download never leaves a partial image to be reused
+        tmp_path = dest_path.with_name(dest_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(response.content)
+            if dest_path.suffix == ".png":
+                _quantize_png(tmp_path)
+            os.replace(tmp_path, dest_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return dest_path